@@ -3,27 +3,60 @@
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 from callibri_control.control.keyboard_emulator import KeyboardAction, parse_keys
 from callibri_control.control.mouse_emulator import MouseAction
 
+try:
+    import orjson
+except ImportError:  # orjson опционален: без него работаем через stdlib json
+    orjson = None
+
 
 Action = Dict[str, object]
 
 
-@dataclass
+def intern_gesture(name: str) -> str:
+    """Интернирует имя жеста: ключи индекса профиля интернированы, поиск сравнивает по ссылке."""
+    return sys.intern(name)
+
+
+@dataclass(slots=True)
+class MacroAction:
+    # (действие, пауза после него в секундах); None — шаг неизвестного типа, от него остаётся только пауза
+    steps: List[Tuple[Optional[Union[KeyboardAction, MouseAction]], float]]
+
+
+CompiledAction = Union[KeyboardAction, MouseAction, MacroAction]
+
+
+@dataclass(slots=True)
 class GestureBinding:
     gesture: str
     action: Action
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     name: str
     bindings: List[GestureBinding] = field(default_factory=list)
+    _index: Dict[str, CompiledAction] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Перестраивает индекс жест -> готовое действие (вызывать после изменения bindings)."""
+        index: Dict[str, CompiledAction] = {}
+        for b in self.bindings:
+            compiled = ActionMapper.build_action(b.action)
+            if compiled is not None:
+                index[intern_gesture(b.gesture)] = compiled
+        self._index = index
 
 
 class ActionMapper:
@@ -34,19 +67,39 @@ class ActionMapper:
 
     def __init__(self) -> None:
         self.profiles: Dict[str, Profile] = {}
-        self.active_profile: Optional[str] = None
+        self._active_profile: Optional[str] = None
+        # Ссылка на активный Profile, чтобы resolve не ходил в self.profiles на каждый жест
+        self._active_profile_obj: Optional[Profile] = None
+
+    @property
+    def active_profile(self) -> Optional[str]:
+        return self._active_profile
+
+    @active_profile.setter
+    def active_profile(self, name: Optional[str]) -> None:
+        self._active_profile = name
+        self._active_profile_obj = self.profiles.get(name) if name is not None else None
+
+    def add_profile(self, profile: Profile) -> None:
+        self.profiles[profile.name] = profile
+        if profile.name == self._active_profile:
+            self._active_profile_obj = profile
 
     def load_from_file(self, path: Path) -> None:
         if not path.exists():
             return
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            if orjson is not None:
+                data = orjson.loads(path.read_bytes())
+            else:
+                data = json.loads(path.read_text(encoding="utf-8"))
         except Exception:
             return
         self.profiles.clear()
+        self._active_profile_obj = None
         for name, bindings in data.items():
             gb_list = [GestureBinding(g, a) for g, a in bindings.items()]
-            self.profiles[name] = Profile(name=name, bindings=gb_list)
+            self.add_profile(Profile(name=name, bindings=gb_list))
         if self.profiles:
             self.active_profile = next(iter(self.profiles.keys()))
 
@@ -55,7 +108,10 @@ class ActionMapper:
             name: {b.gesture: b.action for b in prof.bindings}
             for name, prof in self.profiles.items()
         }
-        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
 
     def set_active(self, name: str) -> None:
         # Не падаем, если профиль отсутствует — оставляем активный как есть
@@ -63,15 +119,39 @@ class ActionMapper:
             return
         self.active_profile = name
 
-    def resolve(self, gesture: str) -> Optional[Action]:
-        if self.active_profile is None or self.active_profile not in self.profiles:
+    def resolve(self, gesture: str) -> Optional[CompiledAction]:
+        profile = self._active_profile_obj
+        return profile._index.get(gesture) if profile is not None else None
+
+    # Конвертация action dict -> объект действия (выполняется один раз при загрузке профиля)
+    @staticmethod
+    def build_action(action: Action) -> Optional[CompiledAction]:
+        if not isinstance(action, dict):
+            return None
+        try:
+            kind = action.get("type")
+            if kind == "keyboard":
+                return ActionMapper.to_keyboard_action(action)
+            if kind == "mouse":
+                return ActionMapper.to_mouse_action(action)
+            if kind == "macro":
+                steps = []
+                for step in action.get("steps", []):
+                    if not isinstance(step, dict):
+                        continue
+                    if step.get("type") == "keyboard":
+                        step_action = ActionMapper.to_keyboard_action(step)
+                    elif step.get("type") == "mouse":
+                        step_action = ActionMapper.to_mouse_action(step)
+                    else:
+                        step_action = None
+                    steps.append((step_action, step.get("delay", 0) / 1000))
+                return MacroAction(steps=steps)
+        except (TypeError, ValueError, AttributeError):
+            # битая привязка в пользовательском JSON не должна ронять загрузку профилей
             return None
-        for b in self.profiles[self.active_profile].bindings:
-            if b.gesture == gesture:
-                return b.action
         return None
 
-    # Примеры конвертации action dict -> реальный вызов (используется в runtime)
     @staticmethod
     def to_keyboard_action(action: Action) -> KeyboardAction:
         return KeyboardAction(
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
 
 from pynput.keyboard import Controller, Key
 
@@ -12,74 +12,83 @@ from pynput.keyboard import Controller, Key
 KeySpec = List[str]  # e.g. ["ctrl", "alt", "s"] or ["space"]
 
 
+_SPECIAL_KEY_CANDIDATES = {
+    "enter": Key.enter,
+    "return": Key.enter,
+    "space": Key.space,
+    "tab": Key.tab,
+    "esc": Key.esc,
+    "escape": Key.esc,
+    "backspace": Key.backspace,
+    "delete": Key.delete,
+    "del": Key.delete,
+    "insert": getattr(Key, "insert", None),
+    "home": Key.home,
+    "end": Key.end,
+    "pageup": Key.page_up,
+    "pagedown": Key.page_down,
+    "up": Key.up,
+    "down": Key.down,
+    "left": Key.left,
+    "right": Key.right,
+    "capslock": Key.caps_lock,
+    "ctrl": Key.ctrl,
+    "control": Key.ctrl,
+    "alt": Key.alt,
+    "option": getattr(Key, "alt_l", Key.alt),
+    "shift": Key.shift,
+    "cmd": getattr(Key, "cmd", getattr(Key, "cmd_l", None)),
+    "win": getattr(Key, "cmd", getattr(Key, "cmd_l", None)),
+    "meta": getattr(Key, "cmd", getattr(Key, "cmd_l", None)),
+    "f1": Key.f1,
+    "f2": Key.f2,
+    "f3": Key.f3,
+    "f4": Key.f4,
+    "f5": Key.f5,
+    "f6": Key.f6,
+    "f7": Key.f7,
+    "f8": Key.f8,
+    "f9": Key.f9,
+    "f10": Key.f10,
+    "f11": Key.f11,
+    "f12": Key.f12,
+    "printscreen": getattr(Key, "print_screen", None),
+    "scrolllock": getattr(Key, "scroll_lock", None),
+    "pause": getattr(Key, "pause", None),
+    "media_play": getattr(Key, "media_play_pause", None),
+    "media_pause": getattr(Key, "media_play_pause", None),
+    "media_next": getattr(Key, "media_next", None),
+    "media_prev": getattr(Key, "media_previous", None),
+    "volume_up": getattr(Key, "volume_up", None),
+    "volume_down": getattr(Key, "volume_down", None),
+    "volume_mute": getattr(Key, "media_volume_mute", getattr(Key, "mute", None)),
+}
+# Клавиши, которых нет на текущей платформе, не попадают в таблицу и уходят в pynput строкой
+_SPECIAL_KEYS = {name: key for name, key in _SPECIAL_KEY_CANDIDATES.items() if key is not None}
+
+
 def _normalize_key(name: str):
-    name = name.lower()
-    special = {
-        "enter": Key.enter,
-        "return": Key.enter,
-        "space": Key.space,
-        "tab": Key.tab,
-        "esc": Key.esc,
-        "escape": Key.esc,
-        "backspace": Key.backspace,
-        "delete": Key.delete,
-        "del": Key.delete,
-        "insert": getattr(Key, "insert", None),
-        "home": Key.home,
-        "end": Key.end,
-        "pageup": Key.page_up,
-        "pagedown": Key.page_down,
-        "up": Key.up,
-        "down": Key.down,
-        "left": Key.left,
-        "right": Key.right,
-        "capslock": Key.caps_lock,
-        "ctrl": Key.ctrl,
-        "control": Key.ctrl,
-        "alt": Key.alt,
-        "option": getattr(Key, "alt_l", Key.alt),
-        "shift": Key.shift,
-        "cmd": getattr(Key, "cmd", getattr(Key, "cmd_l", None)),
-        "win": getattr(Key, "cmd", getattr(Key, "cmd_l", None)),
-        "meta": getattr(Key, "cmd", getattr(Key, "cmd_l", None)),
-        "f1": Key.f1,
-        "f2": Key.f2,
-        "f3": Key.f3,
-        "f4": Key.f4,
-        "f5": Key.f5,
-        "f6": Key.f6,
-        "f7": Key.f7,
-        "f8": Key.f8,
-        "f9": Key.f9,
-        "f10": Key.f10,
-        "f11": Key.f11,
-        "f12": Key.f12,
-        "printscreen": getattr(Key, "print_screen", None),
-        "scrolllock": getattr(Key, "scroll_lock", None),
-        "pause": getattr(Key, "pause", None),
-        "media_play": getattr(Key, "media_play_pause", None),
-        "media_pause": getattr(Key, "media_play_pause", None),
-        "media_next": getattr(Key, "media_next", None),
-        "media_prev": getattr(Key, "media_previous", None),
-        "volume_up": getattr(Key, "volume_up", None),
-        "volume_down": getattr(Key, "volume_down", None),
-        "volume_mute": getattr(Key, "media_volume_mute", getattr(Key, "mute", None)),
-    }
-    key_obj = special.get(name)
-    return key_obj if key_obj is not None else name
+    """Ожидает имя в нижнем регистре (parse_keys / KeyboardAction приводят его заранее)."""
+    return _SPECIAL_KEYS.get(name, name)
 
 
 def parse_keys(spec: str) -> KeySpec:
-    """Parses 'ctrl+alt+s' -> ['ctrl','alt','s']"""
-    return [part.strip() for part in spec.replace("+", " ").split() if part.strip()]
+    """Parses 'Ctrl+Alt+S' -> ['ctrl','alt','s']"""
+    return [part.strip().lower() for part in spec.replace("+", " ").split() if part.strip()]
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardAction:
     kind: str  # PRESS/HOLD/RELEASE/COMBO/SEQUENCE/TOGGLE/TYPE_TEXT
     keys: KeySpec
     text: str = ""
     delay_ms: int = 30
+    normalized: list = field(default_factory=list)  # keys, уже приведённые к Key/str
+
+    def __post_init__(self) -> None:
+        self.kind = self.kind.upper()
+        if not self.normalized:
+            self.normalized = [_normalize_key(k.lower()) for k in self.keys]
 
 
 class KeyboardEmulator:
@@ -91,43 +100,64 @@ class KeyboardEmulator:
     def __init__(self) -> None:
         self._kb = Controller()
         self._toggles: dict[str, bool] = {}
-
-    def _press_keys(self, keys: Iterable[str]) -> None:
-        for k in keys:
-            key_obj = _normalize_key(k)
+        self._dispatch: Dict[str, Callable[[KeyboardAction], None]] = {
+            "PRESS": self._exec_press,
+            "HOLD": self._exec_hold,
+            "RELEASE": self._exec_release,
+            "COMBO": self._exec_combo,
+            "SEQUENCE": self._exec_sequence,
+            "TOGGLE": self._exec_toggle,
+            "TYPE_TEXT": self._exec_type_text,
+        }
+
+    def _press_keys(self, keys: Iterable) -> None:
+        for key_obj in keys:
             self._kb.press(key_obj)
 
-    def _release_keys(self, keys: Iterable[str]) -> None:
-        for k in keys:
-            key_obj = _normalize_key(k)
+    def _release_keys(self, keys: Iterable) -> None:
+        for key_obj in keys:
             self._kb.release(key_obj)
 
     def execute(self, action: KeyboardAction) -> None:
-        kind = action.kind.upper()
-        if kind == "PRESS":
-            self._press_keys(action.keys)
-            self._release_keys(action.keys)
-        elif kind == "HOLD":
-            self._press_keys(action.keys)
-        elif kind == "RELEASE":
-            self._release_keys(action.keys)
-        elif kind == "COMBO":
-            self._press_keys(action.keys)
-            self._release_keys(reversed(action.keys))
-        elif kind == "SEQUENCE":
-            for k in action.keys:
-                self._press_keys([k])
-                self._release_keys([k])
-                time.sleep(action.delay_ms / 1000.0)
-        elif kind == "TOGGLE":
-            tag = "+".join(action.keys)
-            if not self._toggles.get(tag):
-                self._press_keys(action.keys)
-                self._toggles[tag] = True
-            else:
-                self._release_keys(action.keys)
-                self._toggles[tag] = False
-        elif kind == "TYPE_TEXT":
-            self._kb.type(action.text)
+        handler = self._dispatch.get(action.kind)
+        if handler is None:
+            raise ValueError(f"Unknown keyboard action: {action.kind}")
+        handler(action)
+
+    def _exec_press(self, action: KeyboardAction) -> None:
+        self._press_keys(action.normalized)
+        self._release_keys(action.normalized)
+
+    def _exec_hold(self, action: KeyboardAction) -> None:
+        self._press_keys(action.normalized)
+
+    def _exec_release(self, action: KeyboardAction) -> None:
+        self._release_keys(action.normalized)
+
+    def _exec_combo(self, action: KeyboardAction) -> None:
+        # Один и тот же нормализованный список: вперёд на нажатие, срезом назад на отпускание
+        keys = action.normalized
+        press = self._kb.press
+        for key_obj in keys:
+            press(key_obj)
+        release = self._kb.release
+        for key_obj in keys[::-1]:
+            release(key_obj)
+
+    def _exec_sequence(self, action: KeyboardAction) -> None:
+        for k in action.normalized:
+            self._kb.press(k)
+            self._kb.release(k)
+            time.sleep(action.delay_ms / 1000.0)
+
+    def _exec_toggle(self, action: KeyboardAction) -> None:
+        tag = "+".join(action.keys)
+        if not self._toggles.get(tag):
+            self._press_keys(action.normalized)
+            self._toggles[tag] = True
         else:
-            raise ValueError(f"Unknown keyboard action: {kind}")
+            self._release_keys(action.normalized)
+            self._toggles[tag] = False
+
+    def _exec_type_text(self, action: KeyboardAction) -> None:
+        self._kb.type(action.text)
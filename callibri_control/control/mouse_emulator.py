@@ -2,29 +2,38 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Tuple
 
 from pynput.mouse import Button, Controller
 
 
-@dataclass
+@dataclass(slots=True)
 class MouseAction:
     kind: str  # MOVE/MOVE_ABS/CLICK/DOUBLE_CLICK/DRAG/DRAG_END/SCROLL
     delta: Tuple[int, int] = (0, 0)  # для MOVE (относительное) или координаты для MOVE_ABS
     button: str = "left"
     scroll: Tuple[int, int] = (0, 0)  # (dx, dy)
+    # (имя, Button) последнего разбора button: пересчитываем, только если поле поменяли
+    _button_cache: Tuple[str, object] = field(default=("", None), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.kind = self.kind.upper()
+
+    @property
+    def pynput_button(self):
+        name, button = self._button_cache
+        if name != self.button:
+            button = _btn(self.button)
+            self._button_cache = (self.button, button)
+        return button
+
+
+_BTN_MAP = {"left": Button.left, "right": Button.right, "middle": Button.middle}
 
 
 def _btn(name: str):
-    name = name.lower()
-    if name == "left":
-        return Button.left
-    if name == "right":
-        return Button.right
-    if name == "middle":
-        return Button.middle
-    return Button.left
+    return _BTN_MAP.get(name.lower(), Button.left)
 
 
 class MouseEmulator:
@@ -33,31 +42,48 @@ class MouseEmulator:
     def __init__(self) -> None:
         self._mouse = Controller()
         self._dragging = False
+        self._dispatch: Dict[str, Callable[[MouseAction], None]] = {
+            "MOVE": self._exec_move,
+            "MOVE_ABS": self._exec_move_abs,
+            "CLICK": self._exec_click,
+            "DOUBLE_CLICK": self._exec_double_click,
+            "DRAG": self._exec_drag,
+            "DRAG_END": self._exec_drag_end,
+            "SCROLL": self._exec_scroll,
+        }
 
     def execute(self, action: MouseAction) -> None:
-        kind = action.kind.upper()
-        if kind == "MOVE":
-            self._mouse.move(action.delta[0], action.delta[1])
-        elif kind == "MOVE_ABS":
-            try:
-                self._mouse.position = action.delta
-            except Exception:
-                # если координаты некорректны/платформа не поддерживает
-                self._mouse.move(action.delta[0], action.delta[1])
-        elif kind == "CLICK":
-            self._mouse.click(_btn(action.button), 1)
-        elif kind == "DOUBLE_CLICK":
-            self._mouse.click(_btn(action.button), 2)
-        elif kind == "DRAG":
-            if not self._dragging:
-                self._mouse.press(_btn(action.button))
-                self._dragging = True
+        handler = self._dispatch.get(action.kind)
+        if handler is None:
+            raise ValueError(f"Unknown mouse action: {action.kind}")
+        handler(action)
+
+    def _exec_move(self, action: MouseAction) -> None:
+        self._mouse.move(action.delta[0], action.delta[1])
+
+    def _exec_move_abs(self, action: MouseAction) -> None:
+        try:
+            self._mouse.position = action.delta
+        except Exception:
+            # если координаты некорректны/платформа не поддерживает
             self._mouse.move(action.delta[0], action.delta[1])
-        elif kind == "DRAG_END":
-            if self._dragging:
-                self._mouse.release(_btn(action.button))
-                self._dragging = False
-        elif kind == "SCROLL":
-            self._mouse.scroll(action.scroll[0], action.scroll[1])
-        else:
-            raise ValueError(f"Unknown mouse action: {kind}")
+
+    def _exec_click(self, action: MouseAction) -> None:
+        self._mouse.click(action.pynput_button, 1)
+
+    def _exec_double_click(self, action: MouseAction) -> None:
+        self._mouse.click(action.pynput_button, 2)
+
+    def _exec_drag(self, action: MouseAction) -> None:
+        if not self._dragging:
+            self._mouse.press(action.pynput_button)
+            self._dragging = True
+        self._mouse.move(action.delta[0], action.delta[1])
+
+    def _exec_drag_end(self, action: MouseAction) -> None:
+        if self._dragging:
+            self._mouse.release(action.pynput_button)
+            self._dragging = False
+
+    def _exec_scroll(self, action: MouseAction) -> None:
+        self._mouse.scroll(action.scroll[0], action.scroll[1])
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import Dict
 
-from callibri_control.control.action_mapper import ActionMapper, GestureBinding, Profile
+from callibri_control.control.action_mapper import ActionMapper, CompiledAction, GestureBinding, Profile
 
 
 DEFAULT_MAPPINGS: Dict[str, Dict[str, dict]] = {
@@ -79,12 +80,21 @@ DEFAULT_MAPPINGS: Dict[str, Dict[str, dict]] = {
 }
 
 
+# Встроенные профили разбираем и компилируем один раз при импорте; каждый ProfileManager
+# получает глубокую копию, так что правки привязок одного менеджера не видны другим
+_DEFAULT_PROFILES: Dict[str, Profile] = {
+    name: Profile(name=name, bindings=[GestureBinding(g, a) for g, a in mapping.items()])
+    for name, mapping in DEFAULT_MAPPINGS.items()
+}
+
+
 class ProfileManager:
     """Manage built-in and custom control profiles."""
 
     def __init__(self, storage: Path | None = None) -> None:
         self.mapper = ActionMapper()
         self.storage = storage
+        self._dirty = False  # есть несохранённые изменения привязок
         self._load_defaults()
         if storage:
             self.mapper.load_from_file(storage)
@@ -92,27 +102,28 @@ class ProfileManager:
             self.mapper.active_profile = "DEFAULT"
 
     def _load_defaults(self) -> None:
-        for name, mapping in DEFAULT_MAPPINGS.items():
-            bindings = [GestureBinding(g, a) for g, a in mapping.items()]
-            self.mapper.profiles[name] = Profile(name=name, bindings=bindings)
+        for profile in _DEFAULT_PROFILES.values():
+            self.mapper.add_profile(copy.deepcopy(profile))
         if self.mapper.profiles and self.mapper.active_profile is None:
             self.mapper.active_profile = "DEFAULT"
 
     def save(self) -> None:
-        if self.storage:
+        # Активный профиль в файл не пишется, поэтому сохраняем только изменённые привязки
+        if self.storage and self._dirty:
             self.mapper.save_to_file(self.storage)
+            self._dirty = False
 
     def list_profiles(self):
         return list(self.mapper.profiles.keys())
 
     def set_active(self, name: str) -> None:
         self.mapper.set_active(name)
-        self.save()
 
-    def get_action(self, gesture: str) -> dict | None:
+    def get_action(self, gesture: str) -> CompiledAction | None:
         return self.mapper.resolve(gesture)
 
     def add_profile(self, name: str, mapping: Dict[str, dict]) -> None:
         bindings = [GestureBinding(g, a) for g, a in mapping.items()]
-        self.mapper.profiles[name] = Profile(name=name, bindings=bindings)
+        self.mapper.add_profile(Profile(name=name, bindings=bindings))
+        self._dirty = True
         self.save()
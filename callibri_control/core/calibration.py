@@ -1,11 +1,25 @@
 import time
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from statistics import median
+from typing import Callable, Dict, Optional, Tuple
 
 import numpy as np
 
 
-@dataclass
+PhaseCallback = Callable[[str], None]
+
+
+# Доля диапазона (MVC - baseline) для порога включения каждого профиля
+THRESHOLD_RATIOS: Dict[str, float] = {
+    "ULTRA_SENSITIVE": 0.08,
+    "SENSITIVE": 0.18,
+    "NORMAL": 0.35,
+    "GAMING": 0.28,
+    "PRECISE": 0.5,
+}
+
+
+@dataclass(slots=True)
 class EMGCalibrationResult:
     baseline: float
     mvc: float
@@ -20,77 +34,112 @@ class Calibration:
     def __init__(self, stream) -> None:
         self.stream = stream
 
-    def calibrate_emg(self, rest_sec: int = 3, mvc_sec: int = 3) -> EMGCalibrationResult:
-        print(f"Расслабьте мышцу на {rest_sec} с...")
+    def calibrate_emg(
+        self,
+        rest_sec: int = 3,
+        mvc_sec: int = 3,
+        interactive: bool = True,
+        on_phase: Optional[PhaseCallback] = None,
+    ) -> EMGCalibrationResult:
+        """
+        Калибровка EMG: baseline в покое, затем MVC.
+        При interactive=False не печатает и не ждёт Enter — фазы сообщаются через on_phase
+        ("rest", "mvc", "done"), MVC начинается сразу после baseline.
+        """
+        if interactive:
+            print(f"Расслабьте мышцу на {rest_sec} с...")
+        elif on_phase:
+            on_phase("rest")
         baseline = self._collect(rest_sec)
-        print(f"Базовый уровень: {baseline:.2f}")
-        input("Готовы к MVC? Нажмите Enter и напрягите мышцу...")
+        if interactive:
+            print(f"Базовый уровень: {baseline:.2f}")
+            input("Готовы к MVC? Нажмите Enter и напрягите мышцу...")
+        elif on_phase:
+            on_phase("mvc")
         mvc = self._collect(mvc_sec)
-        print(f"MVC: {mvc:.2f}")
+        if interactive:
+            print(f"MVC: {mvc:.2f}")
+        elif on_phase:
+            on_phase("done")
         thresholds = self._thresholds(baseline, mvc)
         return EMGCalibrationResult(baseline=baseline, mvc=mvc, thresholds=thresholds)
 
-    def calibrate_mems(self, duration: int = 3) -> "MemsCalibrationResult":
+    def calibrate_mems(
+        self,
+        duration: int = 3,
+        interactive: bool = True,
+        on_phase: Optional[PhaseCallback] = None,
+    ) -> "MemsCalibrationResult":
         """
         Калибровка MEMS: фиксируем текущие углы как нейтральные и оцениваем bias акселерометра.
-        Просит положить датчик на ровную поверхность.
+        Просит положить датчик на ровную поверхность (при interactive=False — только on_phase("mems")).
         """
-        print("Положите датчик на ровную горизонтальную поверхность и не двигайте его.")
-        print(f"Сбор данных {duration} с...")
-        angles: list[Tuple[float, float, float]] = []
-        accs: list[Tuple[float, float, float]] = []
-        end = time.time() + duration
-        while time.time() < end:
-            metrics = self.stream.latest_metrics()
-            pitch = metrics.get("pitch", 0.0)
-            roll = metrics.get("roll", 0.0)
-            yaw = metrics.get("yaw", 0.0)
-            acc_x = metrics.get("acc_x", 0.0)
-            acc_y = metrics.get("acc_y", 0.0)
-            acc_z = metrics.get("acc_z", 0.0)
-            angles.append((pitch, roll, yaw))
-            accs.append((acc_x, acc_y, acc_z))
-            time.sleep(0.05)
-        baseline_pitch, baseline_roll, baseline_yaw = np.mean(angles, axis=0) if angles else (0.0, 0.0, 0.0)
-        acc_bias = tuple(np.mean(accs, axis=0)) if accs else (0.0, 0.0, 0.0)
+        if interactive:
+            print("Положите датчик на ровную горизонтальную поверхность и не двигайте его.")
+            print(f"Сбор данных {duration} с...")
+        elif on_phase:
+            on_phase("mems")
+        # Буферы выделяем заранее под частоту MEMS; при переполнении пишем по кругу,
+        # усредняя последние n_max пакетов
+        # Одна строка на пакет: pitch, roll, yaw, acc_x, acc_y, acc_z
+        n_max = int(duration * self.stream.mems_rate) + 8
+        samples = np.empty((n_max, 6), dtype=np.float64)
+        i = 0
+        seq = self.stream.data_seq("mems")
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            # не больше одного отсчёта на пакет акселерометра (кватернионы ожидание не будят),
+            # поэтому n_max по mems_rate хватает на всё окно
+            new_seq = self.stream.wait_for_new_data("mems", seq, timeout=0.1)
+            if new_seq == seq:
+                continue
+            seq = new_seq
+            samples[i % n_max] = self.stream.latest_mems_snapshot()
+            i += 1
+        filled = min(i, n_max)
+        mean = samples[:filled].mean(axis=0) if filled else np.zeros(6)
+        baseline_pitch, baseline_roll, baseline_yaw = mean[:3]
+        acc_bias = tuple(mean[3:])
         result = MemsCalibrationResult(
             baseline_pitch=float(baseline_pitch),
             baseline_roll=float(baseline_roll),
             baseline_yaw=float(baseline_yaw),
             acc_bias=(float(acc_bias[0]), float(acc_bias[1]), float(acc_bias[2])),
         )
-        print(
-            f"MEMS нейтраль: pitch={result.baseline_pitch:.2f}, roll={result.baseline_roll:.2f}, yaw={result.baseline_yaw:.2f}"
-        )
-        print(
-            "Смещения акселерометра (используются для вычитания гравитации): "
-            f"ax={result.acc_bias[0]:.3f}, ay={result.acc_bias[1]:.3f}, az={result.acc_bias[2]:.3f}"
-        )
+        if interactive:
+            print(
+                f"MEMS нейтраль: pitch={result.baseline_pitch:.2f}, roll={result.baseline_roll:.2f}, yaw={result.baseline_yaw:.2f}"
+            )
+            print(
+                "Смещения акселерометра (используются для вычитания гравитации): "
+                f"ax={result.acc_bias[0]:.3f}, ay={result.acc_bias[1]:.3f}, az={result.acc_bias[2]:.3f}"
+            )
+        elif on_phase:
+            on_phase("done")
         return result
 
     def _collect(self, duration: int) -> float:
         values = []
-        end = time.time() + duration
-        while time.time() < end:
-            metrics = self.stream.latest_metrics()
-            rms = metrics.get("emg_rms")
+        seq = self.stream.data_seq("emg")
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            new_seq = self.stream.wait_for_new_data("emg", seq, timeout=0.1)
+            if new_seq == seq:
+                continue
+            seq = new_seq
+            rms = self.stream.latest_emg_rms()
             if rms:
                 values.append(rms)
-            time.sleep(0.05)
-        return float(np.median(values) if values else 0.0)
+        # одно значение на пакет EMG — сотни за окно; медиана считается раз на фазу, и на таких
+        # размерах statistics.median по списку всё ещё быстрее np.median (~7 против ~17 мкс на 300)
+        return float(median(values)) if values else 0.0
 
     def _thresholds(self, baseline: float, mvc: float) -> Dict[str, float]:
         span = max(mvc - baseline, 1e-6)
-        return {
-            "ULTRA_SENSITIVE": baseline + span * 0.08,
-            "SENSITIVE": baseline + span * 0.18,
-            "NORMAL": baseline + span * 0.35,
-            "GAMING": baseline + span * 0.28,
-            "PRECISE": baseline + span * 0.5,
-        }
+        return {name: baseline + span * ratio for name, ratio in THRESHOLD_RATIOS.items()}
 
 
-@dataclass
+@dataclass(slots=True)
 class MemsCalibrationResult:
     baseline_pitch: float
     baseline_roll: float
@@ -4,8 +4,8 @@ import logging
 import math
 import threading
 import time
-from collections import deque
-from typing import Callable, Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -24,32 +24,97 @@ from neurosdk.neuro_lib_load import _neuro_lib
 
 Callback = Callable[[Dict], None]
 
+# Сколько отсчётов брать из одного пакета прямого signal-коллбека (остаток пакета отбрасывается)
+_SIGNAL_CB_MAX_SAMPLES = 32
+
+# Поддерживаемые частоты EMG (Гц) -> значение SDK
+_SF_MAP = {
+    125: SensorSamplingFrequency.FrequencyHz125,
+    250: SensorSamplingFrequency.FrequencyHz250,
+    500: SensorSamplingFrequency.FrequencyHz500,
+    1000: SensorSamplingFrequency.FrequencyHz1000,
+    2000: SensorSamplingFrequency.FrequencyHz2000,
+}
+
+# Перевод радиан в градусы умножением: без вызова math.degrees на каждый угол
+_RAD2DEG = 180.0 / math.pi
+
+# Раскладка NativeCallibriEnvelopeData для чтения массива пакетов одним np.frombuffer
+_ENVELOPE_DTYPE = np.dtype(
+    {
+        "names": ["Sample"],
+        "formats": [np.float64],
+        "offsets": [NativeCallibriEnvelopeData.Sample.offset],
+        "itemsize": ctypes.sizeof(NativeCallibriEnvelopeData),
+    }
+)
+
+# Заголовки NativeCallibriSignalData (указатель на отсчёты + их число) одним np.frombuffer
+_SIGNAL_DTYPE = np.dtype(
+    {
+        "names": ["Samples", "SzSamples"],
+        "formats": [np.uintp, np.uint32],
+        "offsets": [NativeCallibriSignalData.Samples.offset, NativeCallibriSignalData.SzSamples.offset],
+        "itemsize": ctypes.sizeof(NativeCallibriSignalData),
+    }
+)
+_SAMPLE_SIZE = ctypes.sizeof(ctypes.c_double)
+
+
+@dataclass(slots=True)
+class StreamMetrics:
+    """Основные метрики для горячего цикла: доступ по атрибутам вместо dict.get по строке."""
+
+    emg_rms: float = 0.0
+    pitch: float = 0.0
+    roll: float = 0.0
+    yaw: float = 0.0
+    acc_magnitude: float = 0.0
+
 
 def quaternion_to_euler_deg(w: float, x: float, y: float, z: float) -> Tuple[float, float, float]:
     """Преобразует кватернион в углы Эйлера (pitch, roll, yaw) в градусах."""
-    # нормализация на случай дрейфа масштаба
-    norm = math.sqrt(w * w + x * x + y * y + z * z)
-    if norm == 0:
+    # Без явной нормализации: все члены формулы ZYX квадратичны по компонентам, поэтому
+    # вместо деления на |q| подставляем |q|² вместо 1 (atan2 не зависит от общего масштаба)
+    xx, yy, zz = x * x, y * y, z * z
+    norm_sq = w * w + xx + yy + zz
+    if norm_sq == 0:
         return 0.0, 0.0, 0.0
-    w, x, y, z = w / norm, x / norm, y / norm, z / norm
+    roll = math.atan2(2 * (w * x + y * z), norm_sq - 2 * (xx + yy))  # x-ось
+    sinp = 2 * (w * y - z * x)
+    if norm_sq != 1.0:
+        sinp /= norm_sq
+    pitch = math.asin(max(-1.0, min(1.0, sinp)))  # y-ось, clamp at ±90°
+    yaw = math.atan2(2 * (w * z + x * y), norm_sq - 2 * (yy + zz))  # z-ось
+    return pitch * _RAD2DEG, roll * _RAD2DEG, yaw * _RAD2DEG
 
-    # roll (x-ось)
-    sinr_cosp = 2 * (w * x + y * z)
-    cosr_cosp = 1 - 2 * (x * x + y * y)
-    roll = math.degrees(math.atan2(sinr_cosp, cosr_cosp))
 
-    # pitch (y-ось)
-    sinp = 2 * (w * y - z * x)
-    if abs(sinp) >= 1:
-        pitch = math.degrees(math.copysign(math.pi / 2, sinp))  # clamp at 90°
-    else:
-        pitch = math.degrees(math.asin(sinp))
+def acc_to_pitch_roll_deg(ax: float, ay: float, az: float) -> Tuple[float, float]:
+    """Наклон (pitch, roll) в градусах по вектору гравитации из акселерометра."""
+    return math.atan2(ax, math.hypot(ay, az)) * _RAD2DEG, math.atan2(ay, az) * _RAD2DEG
 
-    # yaw (z-ось)
-    siny_cosp = 2 * (w * z + x * y)
-    cosy_cosp = 1 - 2 * (y * y + z * z)
-    yaw = math.degrees(math.atan2(siny_cosp, cosy_cosp))
-    return pitch, roll, yaw
+
+def acc_to_pitch_roll_deg_batch(acc: np.ndarray) -> np.ndarray:
+    """Векторная версия acc_to_pitch_roll_deg: (N, 3) [ax, ay, az] -> (N, 2) [pitch, roll] в градусах."""
+    a = np.asarray(acc, dtype=np.float64)
+    out = np.empty((a.shape[0], 2), dtype=np.float64)
+    out[:, 0] = np.arctan2(a[:, 0], np.hypot(a[:, 1], a[:, 2]))
+    out[:, 1] = np.arctan2(a[:, 1], a[:, 2])
+    return np.degrees(out, out=out)
+
+
+def quaternion_to_euler_deg_batch(quats: np.ndarray) -> np.ndarray:
+    """Векторная версия quaternion_to_euler_deg: (N, 4) [w, x, y, z] -> (N, 3) [pitch, roll, yaw] в градусах."""
+    q = np.asarray(quats, dtype=np.float64)
+    w, x, y, z = q.T
+    xx, yy, zz = x * x, y * y, z * z
+    norm_sq = w * w + xx + yy + zz
+    norm_sq[norm_sq == 0] = np.inf  # нулевой кватернион даёт нулевые углы, как в скалярной версии
+    out = np.empty((q.shape[0], 3), dtype=np.float64)
+    out[:, 0] = np.arcsin(np.clip(2 * (w * y - z * x) / norm_sq, -1.0, 1.0))
+    out[:, 1] = np.arctan2(2 * (w * x + y * z), norm_sq - 2 * (xx + yy))
+    out[:, 2] = np.arctan2(2 * (w * z + x * y), norm_sq - 2 * (yy + zz))
+    return np.degrees(out, out=out)
 
 
 class DataStream:
@@ -69,6 +134,8 @@ class DataStream:
         enable_mems: bool = True,
         enable_orientation: bool = True,
     ) -> None:
+        if emg_rate not in _SF_MAP:
+            raise ValueError(f"Неподдерживаемая частота EMG {emg_rate} Гц, допустимо: {sorted(_SF_MAP)}")
         self.device = device
         self.emg_rate = emg_rate
         self.mems_rate = mems_rate
@@ -76,25 +143,49 @@ class DataStream:
         self.enable_mems = enable_mems
         self.enable_orientation = enable_orientation
 
-        self.emg_buffer: Deque[float] = deque(maxlen=int(emg_rate * emg_buffer_sec))
-        self.acc_buffer: Deque[Tuple[float, float, float]] = deque(maxlen=int(mems_rate * 2))
-        self.gyro_buffer: Deque[Tuple[float, float, float]] = deque(maxlen=int(mems_rate * 2))
-        self.quat_buffer: Deque[Tuple[float, float, float, float]] = deque(maxlen=int(mems_rate * 2))
+        # EMG храним в кольцевом буфере float32: запись и чтение хвоста без Python-объектов на отсчёт
+        self._emg_ring = np.zeros(max(int(emg_rate * emg_buffer_sec), 1), dtype=np.float32)
+        self._emg_head = 0  # позиция следующей записи
+        self._emg_count = 0  # сколько отсчётов в буфере (<= ёмкости)
+        # сумма квадратов последних _sumsq_window отсчётов, обновляется при записи (RMS за O(k))
+        self._sumsq = 0.0
+        self._sumsq_window = 0
+        self._sumsq_pending = 0  # отсчётов с последнего полного пересчёта (ограничиваем дрейф)
+        # MEMS/кватернионы: кольцевые массивы по строке на пакет (acc и gyro пишутся вместе)
+        mems_cap = max(int(mems_rate * 2), 1)
+        self._acc_ring = np.zeros((mems_cap, 3), dtype=np.float64)
+        self._gyro_ring = np.zeros((mems_cap, 3), dtype=np.float64)
+        self._mems_head = 0
+        self._mems_count = 0
+        self._quat_ring = np.zeros((mems_cap, 4), dtype=np.float64)
+        self._quat_head = 0
+        self._quat_count = 0
 
         self._callbacks: Dict[str, List[Callback]] = {"emg": [], "mems": [], "orientation": [], "stats": []}
-        self._lock = threading.RLock()
+        # неизменяемые снимки списков для _emit: без копий и блокировок на каждом тике
+        self._cb_tuples: Dict[str, Tuple[Callback, ...]] = {}
+        # Под замком только чтение/запись буферов; вычисления и коллбеки — снаружи
+        self._lock = threading.Lock()
         self._running = False
         self._stop = threading.Event()
         self._worker: Optional[threading.Thread] = None
         self._logger = logging.getLogger(__name__)
+        # Опубликованный снимок метрик: не изменяется на месте, только заменяется ссылкой
         self._latest: Dict[str, float] = {}
+        self._latest_stream = StreamMetrics()
+        # Счётчики пришедших пакетов под условием: каждый ждущий сравнивает со своим последним
+        # увиденным номером, поэтому ни пакет, ни уведомление другого потребителя не теряются
+        self._data_cond = threading.Condition()
+        self._data_seq = {"emg": 0, "mems": 0}
         self.rms_window_sec = rms_window_sec
         self._signal_handle: Optional[CallibriSignalDataListenerHandle] = None
         self._envelope_handle: Optional[CallibriEnvelopeDataListenerHandle] = None
         self._signal_cb = None
         self._envelope_cb = None
         self._emg_samples_total = 0
-        self._last_emg_warn = 0.0
+        self._tick = 0
+        self._tick_period = 0.1  # период _loop, с
+        self._last_emg_warn = -math.inf  # time.monotonic(); первое предупреждение сразу
         self._emg_mode = "envelope" if use_envelope else "signal"
         self._emg_started_at = 0.0
         self._using_sdk_signal = False
@@ -108,7 +199,15 @@ class DataStream:
 
     # Public API ------------------------------------------------------------
     def add_callback(self, event: str, cb: Callback) -> None:
-        self._callbacks.setdefault(event, []).append(cb)
+        callbacks = self._callbacks.setdefault(event, [])
+        callbacks.append(cb)
+        self._cb_tuples[event] = tuple(callbacks)
+
+    def set_tick_period(self, period: float) -> None:
+        """Меняет период обновления метрик фонового цикла (по умолчанию 0.1 с)."""
+        if period <= 0:
+            raise ValueError("period должен быть > 0")
+        self._tick_period = float(period)
 
     def set_orientation_offsets(self, pitch: float, roll: float, yaw: float = 0.0) -> None:
         """Устанавливает базовые смещения ориентации после калибровки."""
@@ -137,52 +236,93 @@ class DataStream:
             self._worker.join(timeout=1.0)
 
     def latest_metrics(self) -> Dict[str, float]:
-        metrics: Dict[str, float] = {}
-        with self._lock:
-            rms = self._compute_rms()
-            metrics["emg_rms"] = rms
-            metrics["emg_mode"] = self._emg_mode
-
-            if self.acc_buffer:
-                acc = self.acc_buffer[-1]
-                acc_mag = math.sqrt(acc[0] ** 2 + acc[1] ** 2 + acc[2] ** 2)
-                metrics.update({"acc_x": acc[0], "acc_y": acc[1], "acc_z": acc[2], "acc_magnitude": acc_mag})
-
-            if self.quat_buffer:
-                quat = self.quat_buffer[-1]
-                pitch, roll, yaw = quaternion_to_euler_deg(*quat)
-                metrics.update({"pitch": pitch - self.pitch_offset, "roll": roll - self.roll_offset, "yaw": yaw - self.yaw_offset, "orientation_source": "quat"})
-            elif self.acc_buffer:
-                ax, ay, az = self.acc_buffer[-1]
-                pitch = math.degrees(math.atan2(ax, math.sqrt(ay * ay + az * az))) - self.pitch_offset
-                roll = math.degrees(math.atan2(ay, az)) - self.roll_offset
-                metrics.update({"pitch": pitch, "roll": roll, "yaw": 0.0, "orientation_source": "acc"})
-
-            self._latest.update(metrics)
-            emg_empty = self._emg_samples_total == 0
-        if emg_empty and time.time() - self._last_emg_warn > 5.0:
+        """Свежие метрики, дополненные последним опубликованным снимком (общий dict, не изменять)."""
+        rms, acc, _gyro, quat, emg_total = self._snapshot()
+        metrics: Dict[str, float] = {"emg_rms": rms, "emg_mode": self._emg_mode}
+
+        if acc:
+            acc_mag = math.sqrt(acc[0] ** 2 + acc[1] ** 2 + acc[2] ** 2)
+            metrics.update({"acc_x": acc[0], "acc_y": acc[1], "acc_z": acc[2], "acc_magnitude": acc_mag})
+
+        orientation = self._orientation_from(acc, quat)
+        if orientation is not None:
+            pitch, roll, yaw, source = orientation
+            metrics.update({"pitch": pitch, "roll": roll, "yaw": yaw, "orientation_source": source})
+
+        # одна сборка нового dict и замена ссылки (атомарна под GIL) вместо update + копии под замком
+        latest = self._latest = {**self._latest, **metrics}
+        if emg_total == 0:
+            self._warn_no_emg()
+        return latest
+
+    def latest_stream_metrics(self) -> StreamMetrics:
+        """То же, что latest_metrics(), но только основные поля; без свежих MEMS — значения прошлого вызова."""
+        rms, acc, _gyro, quat, emg_total = self._snapshot()
+        prev = self._latest_stream
+        acc_mag = math.sqrt(acc[0] ** 2 + acc[1] ** 2 + acc[2] ** 2) if acc else prev.acc_magnitude
+        orientation = self._orientation_from(acc, quat)
+        if orientation is not None:
+            pitch, roll, yaw = orientation[:3]
+        else:
+            pitch, roll, yaw = prev.pitch, prev.roll, prev.yaw
+        latest = self._latest_stream = StreamMetrics(rms, pitch, roll, yaw, acc_mag)
+        if emg_total == 0:
+            self._warn_no_emg()
+        return latest
+
+    def _warn_no_emg(self) -> None:
+        now = time.monotonic()
+        if now - self._last_emg_warn > 5.0:
             self._logger.warning("Нет EMG данных: проверьте подключение/электроды или попробуйте --envelope")
-            self._last_emg_warn = time.time()
-        return dict(self._latest)
+            self._last_emg_warn = now
+
+    def latest_mems_snapshot(self) -> Tuple[float, float, float, float, float, float]:
+        """Последние (pitch, roll, yaw, acc_x, acc_y, acc_z) одним вызовом, без пересчёта RMS."""
+        with self._lock:
+            acc = self._acc_ring[self._mems_head - 1].tolist() if self._mems_count else None
+            quat = self._quat_ring[self._quat_head - 1].tolist() if self._quat_count else None
+        orientation = self._orientation_from(acc, quat)
+        pitch, roll, yaw = orientation[:3] if orientation is not None else (0.0, 0.0, 0.0)
+        ax, ay, az = acc if acc else (0.0, 0.0, 0.0)
+        return pitch, roll, yaw, ax, ay, az
+
+    def data_seq(self, kind: str = "emg") -> int:
+        """Номер последнего пришедшего пакета ("emg" или "mems") — начальное значение для wait_for_new_data."""
+        with self._data_cond:
+            return self._data_seq[kind]
+
+    def wait_for_new_data(self, kind: str = "emg", last_seen: int = 0, timeout: float = 0.1) -> int:
+        """
+        Ждёт пакет новее last_seen; возвращает текущий номер (== last_seen, если за timeout ничего не пришло).
+        """
+        with self._data_cond:
+            self._data_cond.wait_for(lambda: self._data_seq[kind] != last_seen, timeout)
+            return self._data_seq[kind]
+
+    def _notify_data(self, kind: str) -> None:
+        with self._data_cond:
+            self._data_seq[kind] += 1
+            self._data_cond.notify_all()
+
+    def latest_emg_rms(self) -> float:
+        with self._lock:
+            return self._compute_rms()
 
     def emg_preview(self, count: int = 120) -> list[float]:
         """Возвращает последние N EMG отсчётов для визуализации."""
+        if count <= 0:
+            return []
         with self._lock:
-            if not self.emg_buffer:
+            if not self._emg_count:
                 return []
-            return list(self.emg_buffer)[-count:]
+            # под блокировкой только копия хвоста кольца, Python float'ы собираем снаружи
+            tail = self._emg_tail(min(count, self._emg_count)).copy()
+        return tail.tolist()
 
     # Internal --------------------------------------------------------------
     def _configure_sampling(self) -> None:
-        sf_map = {
-            250: SensorSamplingFrequency.FrequencyHz250,
-            500: SensorSamplingFrequency.FrequencyHz500,
-            1000: SensorSamplingFrequency.FrequencyHz1000,
-        }
-        desired = sf_map.get(self.emg_rate)
-        if desired:
-            with contextlib.suppress(Exception):
-                self.device.sampling_frequency = desired
+        with contextlib.suppress(Exception):
+            self.device.sampling_frequency = _SF_MAP[self.emg_rate]
 
     def _attach_callbacks(self) -> None:
         if self.use_envelope:
@@ -221,7 +361,7 @@ class DataStream:
             elif self.device.is_supported_command(SensorCommand.StartSignal):
                 self.device.exec_command(SensorCommand.StartSignal)
                 self._emg_mode = "signal"
-            self._emg_started_at = time.time()
+            self._emg_started_at = time.monotonic()
             if self.enable_mems and self.device.is_supported_command(SensorCommand.StartMEMS):
                 self.device.exec_command(SensorCommand.StartMEMS)
             if self.enable_orientation and self.device.is_supported_command(SensorCommand.StartAngle):
@@ -241,26 +381,18 @@ class DataStream:
         @SignalCallbackCallibri
         def _cb(ptr, data, sz, user_data):  # noqa: ANN001
             try:
-                samples: List[float] = []
-                for i in range(sz):
-                    pkt = data[i]
-                    count = int(pkt.SzSamples)
-                    if count <= 0 or count > 256:
-                        continue
-                    raw_ptr = pkt.Samples
-                    if not raw_ptr:
-                        continue
-                    try:
-                        arr = ctypes.cast(raw_ptr, ctypes.POINTER(ctypes.c_double * count)).contents
-                        limit = min(count, 32)
-                        samples.extend([arr[j] for j in range(limit)])
-                    except Exception as exc_inner:  # noqa: BLE001
-                        self._logger.debug("signal pkt parse fail: %s", exc_inner)
-                        continue
-                if samples:
-                    with self._lock:
-                        self.emg_buffer.extend(samples)
-                        self._emg_samples_total += len(samples)
+                if sz <= 0:
+                    return
+                # без ctypes-объекта на пакет: заголовки читаем массивом, отсчёты — сырыми байтами
+                headers = np.frombuffer(ctypes.string_at(data, sz * _SIGNAL_DTYPE.itemsize), dtype=_SIGNAL_DTYPE)
+                string_at = ctypes.string_at
+                chunks = [
+                    string_at(addr, min(count, _SIGNAL_CB_MAX_SAMPLES) * _SAMPLE_SIZE)
+                    for addr, count in zip(headers["Samples"].tolist(), headers["SzSamples"].tolist())
+                    if addr and 0 < count <= 256
+                ]
+                if chunks:
+                    self._append_emg(np.frombuffer(b"".join(chunks), dtype=np.float64))
             except Exception as exc:  # noqa: BLE001
                 self._logger.debug("signal callback failed: %s", exc)
 
@@ -294,10 +426,9 @@ class DataStream:
         @EnvelopeDataCallbackCallibri
         def _cb(ptr, data, sz, user_data):  # noqa: ANN001
             try:
-                with self._lock:
-                    for i in range(sz):
-                        self.emg_buffer.append(float(data[i].Sample))
-                        self._emg_samples_total += 1
+                if sz > 0:
+                    raw = ctypes.string_at(data, sz * _ENVELOPE_DTYPE.itemsize)
+                    self._append_emg(np.frombuffer(raw, dtype=_ENVELOPE_DTYPE)["Sample"])
             except Exception as exc:  # noqa: BLE001
                 self._logger.debug("envelope callback failed: %s", exc)
 
@@ -326,7 +457,7 @@ class DataStream:
         try:
             if not self._running or not packets:
                 return
-            samples: List[float] = []
+            samples: List = []
             for packet in packets:
                 count = int(getattr(packet, "SzSamples", 0))
                 if count <= 0 or count > 512:
@@ -336,20 +467,18 @@ class DataStream:
                     continue
                 try:
                     if isinstance(raw_samples, (list, tuple)):
-                        samples.extend(list(raw_samples)[:count])
+                        # срез list/tuple уже копия; np.concatenate примет его без list(...)
+                        samples.append(raw_samples[:count])
                         continue
-                    samples_ptr = ctypes.cast(raw_samples, ctypes.POINTER(ctypes.c_double * count))
+                    samples_ptr = ctypes.cast(raw_samples, ctypes.POINTER(ctypes.c_double))
                     if not samples_ptr:
                         continue
-                    arr = samples_ptr.contents
-                    samples.extend([arr[i] for i in range(count)])
+                    samples.append(np.ctypeslib.as_array(samples_ptr, shape=(count,)))
                 except Exception as exc:  # noqa: BLE001
                     self._logger.debug("signal parse failed: %s", exc)
                     continue
             if samples:
-                with self._lock:
-                    self.emg_buffer.extend(samples)
-                    self._emg_samples_total += len(samples)
+                self._append_emg(np.concatenate(samples, dtype=np.float32))
         except Exception as exc:  # noqa: BLE001
             self._logger.debug("on_signal processing failed: %s", exc)
 
@@ -365,9 +494,7 @@ class DataStream:
                     except Exception:
                         continue
             if samples:
-                with self._lock:
-                    self.emg_buffer.extend(samples)
-                    self._emg_samples_total += len(samples)
+                self._append_emg(samples)
         except Exception as exc:  # noqa: BLE001
             self._logger.debug("on_envelope processing failed: %s", exc)
 
@@ -375,79 +502,154 @@ class DataStream:
         if not self._running or not packets:
             return
         last = packets[-1]
-        acc = (
-            last.Accelerometer.X - self.acc_offset[0],
-            last.Accelerometer.Y - self.acc_offset[1],
-            last.Accelerometer.Z - self.acc_offset[2],
-        )
-        gyro = (last.Gyroscope.X, last.Gyroscope.Y, last.Gyroscope.Z)
+        acc_x = last.Accelerometer.X - self.acc_offset[0]
+        acc_y = last.Accelerometer.Y - self.acc_offset[1]
+        acc_z = last.Accelerometer.Z - self.acc_offset[2]
+        gyro = last.Gyroscope
         with self._lock:
-            self.acc_buffer.append(acc)
-            self.gyro_buffer.append(gyro)
+            head = self._mems_head
+            self._acc_ring[head] = (acc_x, acc_y, acc_z)
+            self._gyro_ring[head] = (gyro.X, gyro.Y, gyro.Z)
+            self._mems_head = (head + 1) % self._acc_ring.shape[0]
+            if self._mems_count < self._acc_ring.shape[0]:
+                self._mems_count += 1
+        self._notify_data("mems")
 
     def _on_quaternion(self, _sensor, packets) -> None:
         if not self._running or not packets:
             return
         last = packets[-1]
-        quat = (last.W, last.X, last.Y, last.Z)
         with self._lock:
-            self.quat_buffer.append(quat)
+            head = self._quat_head
+            self._quat_ring[head] = (last.W, last.X, last.Y, last.Z)
+            self._quat_head = (head + 1) % self._quat_ring.shape[0]
+            if self._quat_count < self._quat_ring.shape[0]:
+                self._quat_count += 1
+        # о новых MEMS сообщает только _on_mems: один отсчёт ожидающих на пакет акселерометра
 
     # Worker ----------------------------------------------------------------
     def _loop(self) -> None:
         while not self._stop.is_set():
-            metrics: Dict[str, float] = {}
-            with self._lock:
-                rms = self._compute_rms()
-                metrics["emg_rms"] = rms
-                self._emit("emg", {"rms": rms})
-                # предупреждение, если EMG не приходит
-                if self._emg_samples_total == 0:
-                    now = time.time()
-                    if now - self._last_emg_warn > 5.0:
-                        self._logger.warning(
-                            "Нет EMG данных: проверьте подключение/электроды или попробуйте --envelope"
-                        )
-                        self._last_emg_warn = now
-
-                acc = self.acc_buffer[-1] if self.acc_buffer else None
-                gyro = self.gyro_buffer[-1] if self.gyro_buffer else None
-                quat = self.quat_buffer[-1] if self.quat_buffer else None
-
-                if acc:
-                    acc_mag = math.sqrt(acc[0] ** 2 + acc[1] ** 2 + acc[2] ** 2)
-                    metrics.update({"acc_x": acc[0], "acc_y": acc[1], "acc_z": acc[2], "acc_magnitude": acc_mag})
-                    self._emit("mems", {"acc": acc, "gyro": gyro, "acc_mag": acc_mag})
-
-                if quat:
-                    pitch, roll, yaw = quaternion_to_euler_deg(*quat)
-                    pitch -= self.pitch_offset
-                    roll -= self.roll_offset
-                    yaw -= self.yaw_offset
-                    metrics.update({"pitch": pitch, "roll": roll, "yaw": yaw, "orientation_source": "quat"})
-                    self._emit("orientation", {"pitch": pitch, "roll": roll, "yaw": yaw, "source": "quat"})
-                elif acc:
-                    # упрощённая ориентация по акселерометру
-                    ax, ay, az = acc
-                    pitch = math.degrees(math.atan2(ax, math.sqrt(ay * ay + az * az))) - self.pitch_offset
-                    roll = math.degrees(math.atan2(ay, az)) - self.roll_offset
-                    metrics.update({"pitch": pitch, "roll": roll, "yaw": 0.0, "orientation_source": "acc"})
-                    self._emit("orientation", {"pitch": pitch, "roll": roll, "yaw": 0.0, "source": "acc"})
-
-                self._latest.update(metrics)
-                self._emit("stats", metrics)
-            time.sleep(0.1)
+            rms, acc, gyro, quat, emg_total = self._snapshot()
+            metrics: Dict[str, float] = {"emg_rms": rms}
+            self._emit("emg", {"rms": rms})
+            # предупреждение, если EMG не приходит; часы читаем раз в 16 тиков (~1.6 с при 10 Гц)
+            if emg_total == 0 and (self._tick & 0xF) == 0:
+                now = time.monotonic()
+                if now - self._last_emg_warn > 5.0:
+                    self._logger.warning(
+                        "Нет EMG данных: проверьте подключение/электроды или попробуйте --envelope"
+                    )
+                    self._last_emg_warn = now
+
+            if acc:
+                acc_mag = math.sqrt(acc[0] ** 2 + acc[1] ** 2 + acc[2] ** 2)
+                metrics.update({"acc_x": acc[0], "acc_y": acc[1], "acc_z": acc[2], "acc_magnitude": acc_mag})
+                self._emit("mems", {"acc": acc, "gyro": gyro, "acc_mag": acc_mag})
+
+            orientation = self._orientation_from(acc, quat)
+            if orientation is not None:
+                pitch, roll, yaw, source = orientation
+                metrics.update({"pitch": pitch, "roll": roll, "yaw": yaw, "orientation_source": source})
+                self._emit("orientation", {"pitch": pitch, "roll": roll, "yaw": yaw, "source": source})
+
+            self._latest = {**self._latest, **metrics}
+            self._emit("stats", metrics)
+            self._tick += 1
+            # ожидание на событии остановки: stop() прерывает паузу сразу
+            self._stop.wait(self._tick_period)
+
+    def _snapshot(self):
+        """Короткая критическая секция: RMS и последние отсчёты MEMS/кватерниона."""
+        with self._lock:
+            rms = self._compute_rms()
+            if self._mems_count:
+                acc = tuple(self._acc_ring[self._mems_head - 1].tolist())
+                gyro = tuple(self._gyro_ring[self._mems_head - 1].tolist())
+            else:
+                acc = gyro = None
+            quat = self._quat_ring[self._quat_head - 1].tolist() if self._quat_count else None
+            emg_total = self._emg_samples_total
+        return rms, acc, gyro, quat, emg_total
+
+    def _orientation_from(self, acc, quat) -> Optional[Tuple[float, float, float, str]]:
+        """(pitch, roll, yaw, source) с учётом смещений: по кватерниону, иначе по акселерометру."""
+        if quat:
+            pitch, roll, yaw = quaternion_to_euler_deg(*quat)
+            return pitch - self.pitch_offset, roll - self.roll_offset, yaw - self.yaw_offset, "quat"
+        if acc:
+            pitch, roll = acc_to_pitch_roll_deg(*acc)
+            return pitch - self.pitch_offset, roll - self.roll_offset, 0.0, "acc"
+        return None
+
+    def _append_emg(self, samples) -> None:
+        """Дописывает отсчёты в кольцевой буфер EMG (не более двух срезов при переходе через край)."""
+        data = np.asarray(samples, dtype=np.float32)
+        n = data.shape[0]
+        if n == 0:
+            return
+        cap = self._emg_ring.shape[0]
+        with self._lock:
+            window = self._sumsq_window
+            if 0 < window <= cap and n < window:
+                # из окна уходят первые n + len(окна) - window отсчётов текущего хвоста
+                in_window = min(self._emg_count, window)
+                evicted = self._emg_tail(in_window)[: max(0, in_window + n - window)].astype(np.float64)
+                fresh = data.astype(np.float64)
+                self._sumsq += float(fresh.dot(fresh)) - float(evicted.dot(evicted))
+                self._sumsq_pending += n
+            else:
+                self._sumsq_pending = -1  # окно целиком заменено новыми данными: пересчитать
+            if n >= cap:
+                self._emg_ring[:] = data[-cap:]
+                self._emg_head = 0
+            else:
+                head = self._emg_head
+                first = min(n, cap - head)
+                self._emg_ring[head:head + first] = data[:first]
+                if first < n:
+                    self._emg_ring[: n - first] = data[first:]
+                self._emg_head = (head + n) % cap
+            self._emg_count = min(self._emg_count + n, cap)
+            self._emg_samples_total += n
+            if self._sumsq_pending < 0 or self._sumsq_pending >= self.emg_rate * 10:
+                self._rescan_sumsq(window)
+        self._notify_data("emg")
+
+    def _emg_tail(self, count: int) -> np.ndarray:
+        """Последние count отсчётов по порядку (count <= _emg_count); вызывать под self._lock."""
+        head = self._emg_head
+        if count <= head:
+            return self._emg_ring[head - count:head]
+        return np.concatenate((self._emg_ring[head - count:], self._emg_ring[:head]))
 
     def _compute_rms(self) -> float:
         window_samples = int(self.rms_window_sec * self.emg_rate)
-        if window_samples <= 0 or len(self.emg_buffer) < window_samples:
+        if window_samples <= 0 or self._emg_count < window_samples:
             return 0.0
-        data = np.fromiter(list(self.emg_buffer)[-window_samples:], dtype=float)
-        return float(np.sqrt(np.mean(data ** 2)))
+        if window_samples != self._sumsq_window:
+            self._rescan_sumsq(window_samples)
+        return math.sqrt(max(self._sumsq, 0.0) / window_samples)
+
+    def _rescan_sumsq(self, window: int) -> None:
+        """Полный пересчёт суммы квадратов окна (смена окна, сброс дрейфа); вызывать под self._lock."""
+        self._sumsq_window = window
+        self._sumsq_pending = 0
+        if window <= 0:
+            self._sumsq = 0.0
+            return
+        data = self._emg_tail(min(window, self._emg_count)).astype(np.float64)
+        self._sumsq = float(data.dot(data))
 
     def _emit(self, event: str, payload: Dict) -> None:
-        for cb in self._callbacks.get(event, []):
+        callbacks = self._cb_tuples.get(event, ())
+        i, n = 0, len(callbacks)
+        while i < n:
+            # один try на весь проход; после ошибки продолжаем со следующего обработчика
             try:
-                cb(payload)
+                while i < n:
+                    cb = callbacks[i]
+                    i += 1
+                    cb(payload)
             except Exception as exc:  # noqa: BLE001
-                self._logger.debug("callback %s failed: %s", event, exc)
+                self._logger.debug("callback %s (%r) failed: %s", event, cb, exc)
@@ -52,16 +52,42 @@ class SensorManager:
         self._connect_thread: Optional[threading.Thread] = None
 
     # ------------------------------------------------------------------ Public API
-    def scan_devices(self, timeout: Optional[int] = None) -> List[Dict[str, str]]:
-        """Ищет доступные Callibri по BLE и возвращает список словарей."""
-        duration = timeout or self.scan_timeout
+    def scan_devices(
+        self,
+        timeout: Optional[int] = None,
+        target_address: Optional[str] = None,
+        first_match: bool = False,
+    ) -> List[Dict[str, str]]:
+        """
+        Ищет доступные Callibri по BLE и возвращает список словарей.
+        Без target_address/first_match сканирует весь timeout; иначе возвращается,
+        как только найден нужный адрес (или любой датчик при first_match).
+        """
+        duration = max(timeout or self.scan_timeout, 0.5)
+        found = threading.Event()
+        self._scanner.sensorsChanged = lambda _scanner, _sensors: found.set()
         try:
             self._scanner.start()
         except Exception as exc:  # noqa: BLE001
             self._logger.error("Не удалось запустить сканер: %s", exc)
             return []
 
-        time.sleep(max(duration, 0.5))
+        if target_address or first_match:
+            wanted = target_address.lower() if target_address else None
+            deadline = time.monotonic() + duration
+            while True:
+                with contextlib.suppress(Exception):
+                    sensors = self._scanner.sensors()
+                    if sensors and (wanted is None or any(s.Address.lower() == wanted for s in sensors)):
+                        break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # просыпаемся по sensorsChanged или раз в 100 мс, если коллбек не пришёл
+                found.wait(min(0.1, remaining))
+                found.clear()
+        else:
+            time.sleep(duration)
         devices: List[Dict[str, str]] = []
         try:
             for sensor in self._scanner.sensors():
@@ -74,6 +100,7 @@ class SensorManager:
                     }
                 )
         finally:
+            self._scanner.sensorsChanged = None
             with contextlib.suppress(Exception):
                 self._scanner.stop()
         return devices
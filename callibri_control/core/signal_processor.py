@@ -19,82 +19,188 @@ class SignalProcessor:
         mems_fs: int = 100,
         mems_cutoff: float = 5.0,
         complementary_alpha: float = 0.98,
+        gravity: float = 1.0,
+        yaw_deadband: float = 0.01,
     ) -> None:
         # EMG фильтры
         self.fs = fs
         nyq = fs / 2
         low = max(1.0, band[0]) / nyq
         high = min(band[1], nyq * 0.9) / nyq
-        self.b_band, self.a_band = signal.butter(4, [low, high], btype="band")
-        self.b_notch, self.a_notch = signal.iirnotch(notch / nyq, 30.0)
-        self.b_env, self.a_env = signal.butter(2, envelope_cutoff / nyq, btype="low")
+        # каскады биквадов (SOS) устойчивее передаточной функции высокого порядка
+        self.sos_band = signal.butter(4, [low, high], btype="band", output="sos")
+        self.sos_notch = signal.tf2sos(*signal.iirnotch(notch / nyq, 30.0))
+        self.sos_env = signal.butter(2, envelope_cutoff / nyq, btype="low", output="sos")
+        # полоса и режекция идут подряд без нелинейности между ними — один каскад, один вызов sosfilt
+        self.sos_bandnotch = np.vstack([self.sos_band, self.sos_notch])
+        # состояния фильтров между вызовами: поток чанков фильтруется как один непрерывный сигнал
+        self._zi_bn = np.zeros((self.sos_bandnotch.shape[0], 2))
+        self._zi_env = np.zeros((self.sos_env.shape[0], 2))
+        # рабочие буферы промежуточных стадий (детренд, выпрямление), растут под размер чанка
+        self._detr_buf = np.empty(0)
+        self._rect_buf = np.empty(0)
 
         # MEMS фильтры/параметры
         self.mems_fs = mems_fs
         self.dt = 1.0 / float(mems_fs)
         self.complementary_alpha = complementary_alpha
+        # модуль ускорения в покое (в единицах акселерометра) и мёртвая зона гироскопа для yaw
+        self.gravity = gravity
+        self.yaw_deadband = yaw_deadband
         # коэффициент для простого экспоненциального сглаживания акселерометра
         rc = 1.0 / (2 * math.pi * mems_cutoff)
         self._mems_alpha = self.dt / (rc + self.dt)
-        self._acc_state = np.zeros(3, dtype=float)
-        self._gyro_bias = np.zeros(3, dtype=float)
+        # состояние по осям — обычные float: для трёх чисел ufunc-и numpy дороже арифметики
+        self._acc_x = self._acc_y = self._acc_z = 0.0
+        self._gyro_bias_x = self._gyro_bias_y = self._gyro_bias_z = 0.0
         self._pitch = 0.0
         self._roll = 0.0
         self._yaw = 0.0
 
     # ------------------------------- EMG
     def process_emg(self, samples: np.ndarray) -> Dict[str, np.ndarray | float]:
-        """Возвращает полосовой/ноутч/оболочку и RMS."""
+        """Возвращает полосовой/ноутч/оболочку и RMS; состояние фильтров переносится на следующий чанк."""
         if samples.size == 0:
             return {"filtered": samples, "envelope": samples, "rms": 0.0}
-        detr = samples - np.mean(samples)
-        band = signal.lfilter(self.b_band, self.a_band, detr)
-        notch = signal.lfilter(self.b_notch, self.a_notch, band)
-        rect = np.abs(notch)
-        env = signal.lfilter(self.b_env, self.a_env, rect)
-        rms = float(np.sqrt(np.mean(env**2)))
+        if samples.dtype != np.float64:
+            # среднее int16/float32 считалось бы в исходном типе — приводим один раз
+            samples = np.ascontiguousarray(samples, dtype=np.float64)
+        n = samples.size
+        self._ensure_scratch(n)
+        detr = np.subtract(samples, float(samples.mean()), out=self._detr_buf[:n])
+        notch, self._zi_bn = signal.sosfilt(self.sos_bandnotch, detr, zi=self._zi_bn)
+        rect = np.abs(notch, out=self._rect_buf[:n])
+        env, self._zi_env = signal.sosfilt(self.sos_env, rect, zi=self._zi_env)
+        # BLAS dot без промежуточного массива env ** 2
+        rms = math.sqrt(float(env.dot(env)) / env.size)
         return {"filtered": notch, "envelope": env, "rms": rms}
 
+    def _ensure_scratch(self, n: int) -> None:
+        if self._detr_buf.shape[0] < n:
+            self._detr_buf = np.empty(n)
+            self._rect_buf = np.empty(n)
+
     # ------------------------------- MEMS
     def process_mems(self, acc: Tuple[float, float, float], gyro: Tuple[float, float, float]) -> Dict[str, float]:
         """
         Сглаживание MEMS и комплементарный фильтр: оценивает pitch/roll/yaw.
         gyro — угл. скорость (рад/с или deg/s в зависимости от SDK), используется как есть.
         """
-        acc_arr = np.asarray(acc, dtype=float)
-        gyro_arr = np.asarray(gyro, dtype=float)
+        ax_in, ay_in, az_in = acc
+        gx_in, gy_in, gz_in = gyro
 
         # НЧ сглаживание акселерометра (экспоненциальное)
-        self._acc_state = self._acc_state + self._mems_alpha * (acc_arr - self._acc_state)
+        k = self._mems_alpha
+        ax = self._acc_x = self._acc_x + k * (ax_in - self._acc_x)
+        ay = self._acc_y = self._acc_y + k * (ay_in - self._acc_y)
+        az = self._acc_z = self._acc_z + k * (az_in - self._acc_z)
 
         # Простая компенсация дрейфа гироскопа (скользящее смещение)
-        self._gyro_bias = 0.999 * self._gyro_bias + 0.001 * gyro_arr
-        gyro_corr = gyro_arr - self._gyro_bias
-
-        # Оценка углов по акселерометру
-        ax, ay, az = self._acc_state
-        pitch_acc = math.degrees(math.atan2(ax, math.sqrt(ay * ay + az * az)))
-        roll_acc = math.degrees(math.atan2(ay, az))
+        self._gyro_bias_x = 0.999 * self._gyro_bias_x + 0.001 * gx_in
+        self._gyro_bias_y = 0.999 * self._gyro_bias_y + 0.001 * gy_in
+        self._gyro_bias_z = 0.999 * self._gyro_bias_z + 0.001 * gz_in
+        gx = gx_in - self._gyro_bias_x
+        gy = gy_in - self._gyro_bias_y
+        gz = gz_in - self._gyro_bias_z
 
-        # Комплементарный фильтр
-        self._pitch = self.complementary_alpha * (self._pitch + gyro_corr[1] * self.dt) + (1 - self.complementary_alpha) * pitch_acc
-        self._roll = self.complementary_alpha * (self._roll + gyro_corr[0] * self.dt) + (1 - self.complementary_alpha) * roll_acc
-        self._yaw = self._yaw + gyro_corr[2] * self.dt  # без коррекции, будет дрейфовать
-
-        acc_mag = float(math.sqrt(ax * ax + ay * ay + az * az))
+        # Адаптивный комплементарный фильтр: чем сильнее |a| отличается от g, тем меньше веса
+        # у акселерометра; при alpha -> 1 углы по акселерометру не считаем вовсе
+        acc_mag = math.sqrt(ax * ax + ay * ay + az * az)
+        alpha = self._dynamic_alpha(acc_mag)
+        dt = self.dt
+        if alpha >= 0.9999:
+            self._pitch += gy * dt
+            self._roll += gx * dt
+        else:
+            pitch_acc = math.degrees(math.atan2(ax, math.sqrt(ay * ay + az * az)))
+            roll_acc = math.degrees(math.atan2(ay, az))
+            self._pitch = alpha * (self._pitch + gy * dt) + (1 - alpha) * pitch_acc
+            self._roll = alpha * (self._roll + gx * dt) + (1 - alpha) * roll_acc
+        # без коррекции yaw дрейфует; мёртвая зона отсекает интегрирование шума в покое
+        if abs(gz) >= self.yaw_deadband:
+            self._yaw += gz * dt
         return {
-            "acc_x": float(self._acc_state[0]),
-            "acc_y": float(self._acc_state[1]),
-            "acc_z": float(self._acc_state[2]),
-            "gyro_x": float(gyro_corr[0]),
-            "gyro_y": float(gyro_corr[1]),
-            "gyro_z": float(gyro_corr[2]),
+            "acc_x": ax,
+            "acc_y": ay,
+            "acc_z": az,
+            "gyro_x": gx,
+            "gyro_y": gy,
+            "gyro_z": gz,
             "acc_magnitude": acc_mag,
             "pitch": self._pitch,
             "roll": self._roll,
             "yaw": self._yaw,
         }
 
+    def process_mems_batch(self, acc: np.ndarray, gyro: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        То же, что process_mems, для пачки из N отсчётов: acc/gyro формы (N, 3) -> dict массивов длины N.
+        Сглаживание акселерометра и смещение гироскопа — IIR 1-го порядка через lfilter,
+        состояние общее со скалярным process_mems.
+        """
+        acc_arr = np.asarray(acc, dtype=float).reshape(-1, 3)
+        gyro_arr = np.asarray(gyro, dtype=float).reshape(-1, 3)
+        if acc_arr.shape[0] == 0:
+            empty = np.empty(0)
+            keys = ("acc_x", "acc_y", "acc_z", "gyro_x", "gyro_y", "gyro_z", "acc_magnitude", "pitch", "roll", "yaw")
+            return {key: empty for key in keys}
+
+        # y[n] = a*x[n] + (1 - a)*y[n-1]; zi для lfilter — (1 - a)*y[-1]
+        k = self._mems_alpha
+        acc_state = np.array([[self._acc_x, self._acc_y, self._acc_z]])
+        bias_state = np.array([[self._gyro_bias_x, self._gyro_bias_y, self._gyro_bias_z]])
+        acc_f, _ = signal.lfilter([k], [1.0, k - 1.0], acc_arr, axis=0, zi=(1.0 - k) * acc_state)
+        bias, _ = signal.lfilter([0.001], [1.0, -0.999], gyro_arr, axis=0, zi=0.999 * bias_state)
+        self._acc_x, self._acc_y, self._acc_z = acc_f[-1].tolist()
+        self._gyro_bias_x, self._gyro_bias_y, self._gyro_bias_z = bias[-1].tolist()
+        gyro_corr = gyro_arr - bias
+
+        ax, ay, az = acc_f.T
+        pitch_acc = np.degrees(np.arctan2(ax, np.hypot(ay, az)))
+        roll_acc = np.degrees(np.arctan2(ay, az))
+
+        # p[n] = alpha[n]*p[n-1] + (alpha[n]*g[n]*dt + (1 - alpha[n])*p_acc[n]); alpha меняется по отсчётам,
+        # поэтому входы считаем векторно, а саму рекурсию первого порядка — простым циклом по float
+        acc_mag = np.sqrt(ax * ax + ay * ay + az * az)
+        base, dt = self.complementary_alpha, self.dt
+        alpha = np.minimum(1.0, base + (1.0 - base) * np.abs(acc_mag - self.gravity) / self.gravity)
+        alpha[alpha >= 0.9999] = 1.0
+        pitch_in = alpha * dt * gyro_corr[:, 1] + (1 - alpha) * pitch_acc
+        roll_in = alpha * dt * gyro_corr[:, 0] + (1 - alpha) * roll_acc
+        pitch = np.empty_like(pitch_in)
+        roll = np.empty_like(roll_in)
+        p, r = self._pitch, self._roll
+        for i, (a, pu, ru) in enumerate(zip(alpha.tolist(), pitch_in.tolist(), roll_in.tolist())):
+            p = a * p + pu
+            r = a * r + ru
+            pitch[i] = p
+            roll[i] = r
+        gz = gyro_corr[:, 2]
+        yaw = self._yaw + np.cumsum(np.where(np.abs(gz) >= self.yaw_deadband, gz, 0.0) * dt)
+        self._pitch, self._roll, self._yaw = p, r, float(yaw[-1])
+
+        return {
+            "acc_x": ax,
+            "acc_y": ay,
+            "acc_z": az,
+            "gyro_x": gyro_corr[:, 0],
+            "gyro_y": gyro_corr[:, 1],
+            "gyro_z": gyro_corr[:, 2],
+            "acc_magnitude": acc_mag,
+            "pitch": pitch,
+            "roll": roll,
+            "yaw": yaw,
+        }
+
+    def _dynamic_alpha(self, acc_mag: float) -> float:
+        base = self.complementary_alpha
+        return min(1.0, base + (1.0 - base) * abs(acc_mag - self.gravity) / self.gravity)
+
+    def reset_emg(self) -> None:
+        """Сбрасывает состояние EMG фильтров (например, после переподключения)."""
+        self._zi_bn[:] = 0.0
+        self._zi_env[:] = 0.0
+
     def reset_orientation(self) -> None:
         self._pitch = 0.0
         self._roll = 0.0
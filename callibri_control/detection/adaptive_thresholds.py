@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 
 SENSITIVITY_PROFILES: Dict[str, Dict[str, float]] = {
@@ -15,8 +17,13 @@ SENSITIVITY_PROFILES: Dict[str, Dict[str, float]] = {
     "PRECISE": {"on": 0.38, "off": 0.26, "debounce_ms": 280},
 }
 
+# Таблица профилей для расчёта всех порогов одной операцией numpy
+_PROFILE_NAMES: Tuple[str, ...] = tuple(SENSITIVITY_PROFILES)
+_PROFILE_FACTORS = np.array([[cfg["on"], cfg["off"]] for cfg in SENSITIVITY_PROFILES.values()], dtype=float)
+_PROFILE_DEBOUNCE: Tuple[int, ...] = tuple(int(cfg["debounce_ms"]) for cfg in SENSITIVITY_PROFILES.values())
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Thresholds:
     on: float
     off: float
@@ -32,6 +39,9 @@ class AdaptiveThresholds:
         self.mvc = max(mvc, 1e-6)
         self.baseline = baseline
         self.fatigue_factor = 1.0  # 1.0 без коррекции, <1 снижает пороги
+        # Кэш порогов по имени профиля; действителен, пока (mvc, baseline, fatigue_factor) == _cache_key
+        self._cache: Dict[str, Thresholds] = {}
+        self._cache_key: Optional[Tuple[float, float, float]] = None
 
     def update_calibration(self, mvc: float, baseline: float) -> None:
         self.mvc = max(mvc, 1e-6)
@@ -44,6 +54,13 @@ class AdaptiveThresholds:
         self.fatigue_factor = max(0.2, min(factor, 2.0))
 
     def thresholds_for_profile(self, profile: str) -> Thresholds:
+        self._sync_cache()
+        th = self._cache.get(profile)
+        if th is None:
+            th = self._cache[profile] = self._compute(profile)
+        return th
+
+    def _compute(self, profile: str) -> Thresholds:
         cfg = SENSITIVITY_PROFILES.get(profile.upper(), SENSITIVITY_PROFILES["NORMAL"])
         span = self.mvc - self.baseline
         on = self.baseline + span * cfg["on"] * self.fatigue_factor
@@ -51,4 +68,19 @@ class AdaptiveThresholds:
         return Thresholds(on=on, off=off, debounce_ms=int(cfg["debounce_ms"]))
 
     def all_profiles(self) -> Dict[str, Thresholds]:
-        return {name: self.thresholds_for_profile(name) for name in SENSITIVITY_PROFILES}
+        self._sync_cache()
+        cache = self._cache
+        if not all(name in cache for name in _PROFILE_NAMES):
+            span = self.mvc - self.baseline
+            values = (self.baseline + span * self.fatigue_factor * _PROFILE_FACTORS).tolist()
+            for name, (on, off), debounce in zip(_PROFILE_NAMES, values, _PROFILE_DEBOUNCE):
+                cache[name] = Thresholds(on=on, off=off, debounce_ms=debounce)
+        return {name: cache[name] for name in _PROFILE_NAMES}
+
+    def _sync_cache(self) -> None:
+        # ключ сверяем на каждом вызове: кэш сбрасывается только при реальной смене параметров
+        # (в том числе при прямом присваивании mvc/baseline)
+        key = (self.mvc, self.baseline, self.fatigue_factor)
+        if key != self._cache_key:
+            self._cache.clear()
+            self._cache_key = key
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import math
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Dict, Optional
+from typing import Deque, Dict, Optional, Tuple
 
 import numpy as np
-from scipy import signal
+from scipy import fft, signal
 
 
 @dataclass
@@ -29,7 +30,21 @@ class FatigueMonitor:
     def __init__(self, fs: int = 500, window_sec: float = 4.0) -> None:
         self.fs = fs
         self.window_sec = window_sec
-        self.buffer: Deque[float] = deque(maxlen=int(fs * window_sec))
+        # кольцевой буфер окна: запись пачки — не более двух срезов, без float на отсчёт
+        self._buf = np.zeros(max(int(fs * window_sec), 1), dtype=np.float64)
+        self._write = 0  # позиция следующей записи (= _total % размер буфера)
+        self._filled = 0  # сколько отсчётов в буфере
+        self._total = 0  # всего принято отсчётов
+        # Скользящий Welch: сегменты привязаны к абсолютной позиции в потоке (шаг nperseg/2),
+        # периодограмма каждого считается один раз, когда сегмент заполнился, и живёт, пока он в окне
+        self._nperseg = min(512, self._buf.shape[0])
+        self._step = self._nperseg - self._nperseg // 2
+        self._welch_window = signal.get_window("hann", self._nperseg)
+        self._welch_scale = 1.0 / (fs * float(self._welch_window.dot(self._welch_window)))
+        self._freqs = np.fft.rfftfreq(self._nperseg, 1.0 / fs)
+        self._seg_offsets = np.arange(self._nperseg)
+        self._segments: Deque[Tuple[int, np.ndarray]] = deque()  # (начало сегмента, периодограмма)
+        self._next_seg = 0  # номер следующего сегмента для расчёта
         self.baseline_median: Optional[float] = None
         self.baseline_mean: Optional[float] = None
         self.baseline_rms: Optional[float] = None
@@ -38,20 +53,28 @@ class FatigueMonitor:
 
     def update(self, samples) -> Optional[FatigueState]:
         """Принимает numpy/iterable EMG сегмента, возвращает состояние или None, если мало данных."""
-        self.buffer.extend(samples)
-        if len(self.buffer) < self.buffer.maxlen // 2:
+        self._append(samples)
+        cap = self._buf.shape[0]
+        if self._filled < cap // 2:
             return None
 
-        data = np.asarray(self.buffer, dtype=float)
-        rms = float(np.sqrt(np.mean(data**2)))
+        # для RMS порядок отсчётов не важен — считаем прямо по буферу, без склейки окна
+        data = self._buf[: self._filled]
+        rms = math.sqrt(float(data.dot(data)) / data.size)
 
-        freqs, psd = signal.welch(data, fs=self.fs, nperseg=min(512, len(data)))
+        self._update_segments()
+        if self._segments:
+            freqs = self._freqs
+            psd = np.mean([p for _, p in self._segments], axis=0)
+        else:
+            # в окне нет ни одного целого сегмента (короткое окно или начало записи)
+            freqs, psd = signal.welch(self._window(), fs=self.fs, nperseg=self._filled)
         cumsum = np.cumsum(psd)
         total = cumsum[-1] if cumsum.size else 0.0
         if total <= 0:
             return None
         median_freq = float(freqs[np.searchsorted(cumsum, total * 0.5)])
-        mean_freq = float(np.sum(freqs * psd) / total)
+        mean_freq = float(freqs.dot(psd) / total)
 
         if self.baseline_median is None:
             self.baseline_median = median_freq
@@ -69,6 +92,53 @@ class FatigueMonitor:
         self._last_index = index
         return FatigueState(index=index, trend=trend, median_freq=median_freq, mean_freq=mean_freq, rms=rms)
 
+    def _append(self, samples) -> None:
+        chunk = np.asarray(samples, dtype=np.float64).ravel()
+        n = chunk.shape[0]
+        cap = self._buf.shape[0]
+        self._total += n
+        if n > cap:
+            chunk = chunk[-cap:]
+            n = cap
+        if n:
+            # позиция записи от абсолютного номера отсчёта: у обрезанной пачки первые
+            # отсчёты отброшены, и её начало сдвигается вместе с ними
+            head = (self._total - n) % cap
+            first = min(n, cap - head)
+            self._buf[head:head + first] = chunk[:first]
+            if first < n:
+                self._buf[: n - first] = chunk[first:]
+            self._write = (head + n) % cap
+        self._filled = min(self._filled + n, cap)
+
+    def _update_segments(self) -> None:
+        """Досчитывает периодограммы новых сегментов и выкидывает вышедшие из окна."""
+        nperseg, step = self._nperseg, self._step
+        win_start = self._total - self._filled
+        last = (self._total - nperseg) // step  # последний целиком принятый сегмент
+        first = max(self._next_seg, -(-win_start // step))
+        if last >= first:
+            starts = np.arange(first, last + 1) * step
+            segs = self._buf[(starts[:, None] + self._seg_offsets) % self._buf.shape[0]]
+            # как welch(detrend="constant", scaling="density"): пачка сегментов — одно rfft
+            segs -= segs.mean(axis=1, keepdims=True)
+            spec = fft.rfft(segs * self._welch_window, axis=1)
+            psd = spec.real ** 2 + spec.imag ** 2
+            psd *= self._welch_scale
+            psd[:, 1 : None if nperseg % 2 else -1] *= 2.0
+            self._segments.extend(zip(starts.tolist(), psd))
+            self._next_seg = last + 1
+        while self._segments and self._segments[0][0] < win_start:
+            self._segments.popleft()
+
+    def _window(self) -> np.ndarray:
+        """Содержимое окна по порядку; до заполнения и при _write == 0 — view без копии."""
+        if self._filled < self._buf.shape[0]:
+            return self._buf[: self._filled]
+        if self._write == 0:
+            return self._buf
+        return np.concatenate((self._buf[self._write:], self._buf[: self._write]))
+
     def _trend(self, current: float) -> str:
         now = time.time()
         dt = max(now - self._last_time, 1e-3)
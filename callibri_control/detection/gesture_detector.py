@@ -3,14 +3,36 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, NamedTuple, Optional, Union
 
 from callibri_control.detection.adaptive_thresholds import AdaptiveThresholds, Thresholds
 from callibri_control.detection.fatigue_monitor import FatigueMonitor, FatigueState
 
 
-GestureEvent = Dict[str, object]
+class GestureEvent(NamedTuple):
+    """Событие жеста; кортеж вместо dict, чтобы не аллоцировать словарь на каждое срабатывание."""
+
+    type: str
+    value: float
+    duration_ms: int = 0
+    timestamp: float = 0.0
+
+
+# Интервалы (удержание, debounce) меряем по монотонным часам; timestamp событий — wall clock
+_now = time.monotonic
+_NEVER = float("-inf")
+
+
+class Metrics(NamedTuple):
+    """Метрики одного шага детектора; быстрый путь process_metrics без dict.get и float()."""
+
+    emg_rms: float = 0.0
+    pitch: float = 0.0
+    roll: float = 0.0
+    acc_magnitude: float = 1.0
+    yaw: float = 0.0
 
 
 @dataclass
@@ -36,13 +58,17 @@ class GestureDetector:
     - Комбо: FLEX+TILT_{UP/DOWN}
     """
 
+    # (жест при значении > порога, жест при значении < -порога) для pitch и roll
+    TILT_AXES = (("TILT_UP", "TILT_DOWN"), ("TILT_RIGHT", "TILT_LEFT"))
+
     def __init__(self, thresholds: AdaptiveThresholds, fatigue: Optional[FatigueMonitor] = None, config: Optional[DetectorConfig] = None) -> None:
         self.config = config or DetectorConfig()
         self.thresholds_mgr = thresholds
         self.fatigue = fatigue
         self._last_emg_state = "idle"
-        self._last_emg_change = time.time()
-        self._last_flex_ts: List[float] = []
+        self._last_emg_change = _now()
+        self._event_ts = time.time()  # wall-clock метка событий текущего шага
+        self._last_flex_ts: Deque[float] = deque(maxlen=3)  # для TRIPLE_FLEX достаточно трёх последних
         self._last_gesture_ts: Dict[str, float] = {}
         self._fatigue_state: Optional[FatigueState] = None
         self._last_rms = 0.0
@@ -50,29 +76,49 @@ class GestureDetector:
         self._tilt_start_ts: Dict[str, float] = {}
 
     # ------------------------------------------------------------------ Public API
-    def process_metrics(self, metrics: Dict[str, float]) -> List[GestureEvent]:
+    def process_metrics(self, metrics: Union[Metrics, Dict[str, float]]) -> List[GestureEvent]:
         """
-        Принимает словарь метрик (из DataStream.latest_metrics()).
+        Принимает Metrics, StreamMetrics (DataStream.latest_stream_metrics())
+        или словарь метрик (из DataStream.latest_metrics()).
         Возвращает список жестов, возникших на этом шаге.
         """
         events: List[GestureEvent] = []
-        now = time.time()
-
-        rms = float(metrics.get("emg_rms", 0.0))
+        now = _now()
+        self._event_ts = time.time()
+
+        if isinstance(metrics, dict):
+            rms = float(metrics.get("emg_rms", 0.0))
+            pitch = float(metrics.get("pitch", 0.0))
+            roll = float(metrics.get("roll", 0.0))
+            acc_mag = float(metrics.get("acc_magnitude", 1.0))
+        else:
+            rms, pitch, roll, acc_mag = metrics.emg_rms, metrics.pitch, metrics.roll, metrics.acc_magnitude
         self._last_rms = rms
-        pitch = float(metrics.get("pitch", 0.0))
-        roll = float(metrics.get("roll", 0.0))
-        acc_mag = float(metrics.get("acc_magnitude", 1.0))
 
         # Усталость -> корректируем пороги
         if self.fatigue is not None:
-            fs_guess = 500
             fatigue_state = self.fatigue.update([rms])
             if fatigue_state:
                 self._fatigue_state = fatigue_state
                 fatigue_factor = max(0.6, 1.0 - fatigue_state.index * 0.5)
                 self.thresholds_mgr.apply_fatigue(fatigue_factor)
 
+        # Быстрый путь покоя: мышца расслаблена, наклон в пределах, ускорение ниже
+        # порогов и нет начатых наклонов — ни событий, ни переходов состояния быть не может.
+        # (Комбо FLEX_TILT_* требуют наклона, поэтому недавние FLEX не мешают.)
+        cfg = self.config
+        tilt = cfg.tilt_deg
+        if (
+            self._last_emg_state == "idle"
+            and not self._tilt_start_ts
+            and -tilt <= pitch <= tilt
+            and -tilt <= roll <= tilt
+            and acc_mag <= cfg.punch_g
+            and acc_mag <= cfg.shake_g
+            and rms < self.thresholds_mgr.thresholds_for_profile(cfg.profile).on
+        ):
+            return events
+
         # EMG жесты
         events.extend(self._detect_emg(now, rms))
         # MEMS жесты
@@ -122,12 +168,15 @@ class GestureDetector:
         return events
 
     def _register_flex(self, now: float, events: List[GestureEvent], rms: float) -> None:
-        self._last_flex_ts.append(now)
-        self._last_flex_ts = [t for t in self._last_flex_ts if now - t <= self.config.triple_window_ms / 1000]
-        if len(self._last_flex_ts) >= 3:
+        flex_ts = self._last_flex_ts
+        flex_ts.append(now)
+        window = self.config.triple_window_ms / 1000
+        while now - flex_ts[0] > window:
+            flex_ts.popleft()
+        if len(flex_ts) >= 3:
             events.append(self._event("TRIPLE_FLEX", rms))
-            self._last_flex_ts.clear()
-        elif len(self._last_flex_ts) == 2 and (self._last_flex_ts[-1] - self._last_flex_ts[-2]) * 1000 <= self.config.double_window_ms:
+            flex_ts.clear()
+        elif len(flex_ts) == 2 and (flex_ts[-1] - flex_ts[-2]) * 1000 <= self.config.double_window_ms:
             events.append(self._event("DOUBLE_FLEX", rms))
 
     def _detect_gradual(self, now: float, rms: float) -> List[GestureEvent]:
@@ -161,21 +210,15 @@ class GestureDetector:
                 events.append(self._event(name, value))
                 self._tilt_start_ts[name] = now
 
-        if pitch > tilt:
-            _maybe_tilt("TILT_UP", pitch)
-        elif pitch < -tilt:
-            _maybe_tilt("TILT_DOWN", pitch)
-        else:
-            self._tilt_start_ts.pop("TILT_UP", None)
-            self._tilt_start_ts.pop("TILT_DOWN", None)
-
-        if roll > tilt:
-            _maybe_tilt("TILT_RIGHT", roll)
-        elif roll < -tilt:
-            _maybe_tilt("TILT_LEFT", roll)
-        else:
-            self._tilt_start_ts.pop("TILT_RIGHT", None)
-            self._tilt_start_ts.pop("TILT_LEFT", None)
+        tilt_start = self._tilt_start_ts
+        for value, (pos, neg) in zip((pitch, roll), self.TILT_AXES):
+            if value > tilt:
+                _maybe_tilt(pos, value)
+            elif value < -tilt:
+                _maybe_tilt(neg, value)
+            elif tilt_start:
+                tilt_start.pop(pos, None)
+                tilt_start.pop(neg, None)
 
         # Shake / Punch
         if acc_mag > self.config.shake_g and self._debounce("SHAKE", now, 600):
@@ -201,15 +244,10 @@ class GestureDetector:
 
     # ------------------------------------------------------------------ Helpers
     def _event(self, name: str, value: float, duration_ms: int = 0) -> GestureEvent:
-        return {
-            "type": name,
-            "value": value,
-            "duration_ms": duration_ms,
-            "timestamp": time.time(),
-        }
+        return GestureEvent(name, value, duration_ms, self._event_ts)
 
     def _debounce(self, name: str, now: float, window_ms: int) -> bool:
-        last = self._last_gesture_ts.get(name, 0.0)
+        last = self._last_gesture_ts.get(name, _NEVER)
         if (now - last) * 1000 < window_ms:
             return False
         self._last_gesture_ts[name] = now
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
@@ -42,11 +42,38 @@ class HudOverlay(QtWidgets.QWidget):
         self.resize(320, 460)
         self.move(60, 60)
 
+        # Обновления копим и применяем не чаще ~60 Гц: одна перерисовка на кадр вместо каждого вызова
+        self._pending: Dict[str, Any] = {}
+        self._applied: Dict[str, Any] = {}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush)
+
     def update_muscle(self, value: float) -> None:
-        self.muscle.set_value(value)
+        self._schedule("muscle", value)
 
     def update_gesture(self, name: str, confidence: float = 0.0) -> None:
-        self.gesture.set_gesture(name, confidence)
+        self._schedule("gesture", (name, confidence))
 
     def update_fatigue(self, value: int) -> None:
-        self.fatigue.set_value(value)
+        self._schedule("fatigue", value)
+
+    def _schedule(self, key: str, value: Any) -> None:
+        self._pending[key] = value
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        muscle = pending.get("muscle")
+        if muscle is not None and muscle != self._applied.get("muscle"):
+            self.muscle.set_value(muscle)
+        fatigue = pending.get("fatigue")
+        if fatigue is not None and fatigue != self._applied.get("fatigue"):
+            self.fatigue.set_value(fatigue)
+        # жест применяем всегда: повтор того же жеста должен снова подсветиться
+        gesture = pending.get("gesture")
+        if gesture is not None:
+            self.gesture.set_gesture(*gesture)
+        self._applied.update(pending)
@@ -6,12 +6,16 @@
 
 from __future__ import annotations
 
+import logging
+import queue
 import sys
 import threading
 import contextlib
 import os
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 try:
     from PyQt6 import QtCore, QtGui, QtWidgets
@@ -23,6 +27,8 @@ from callibri_control.core.sensor_manager import SensorManager
 from callibri_control.ui.sensor_bridge import SensorBridge
 from callibri_control.control.profiles import DEFAULT_MAPPINGS
 from callibri_control.ui.hud_overlay import HudOverlay
+from callibri_control.ui.widgets import SignalPlot
+from callibri_control.detection.gesture_detector import GestureEvent
 from .pages.analytics_page import AnalyticsPage
 from .pages.control_page import ControlPage
 from .pages.dashboard import DashboardPage
@@ -31,9 +37,92 @@ from .pages.settings_page import SettingsPage
 from .pages.training_page import TrainingPage
 
 
+LOGGER = logging.getLogger(__name__)
+_STYLES_DIR = Path(__file__).resolve().parent / "styles"
+
+
+@lru_cache(maxsize=8)
+def _load_qss(theme: str) -> str:
+    """QSS темы из ui/styles; читается с диска один раз на тему."""
+    try:
+        return (_STYLES_DIR / f"{theme}_theme.qss").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+
+
+_NAV_ICONS: Dict[str, QtGui.QIcon] = {}
+
+
+def _build_nav_icons(emojis: List[str]) -> Dict[str, QtGui.QIcon]:
+    """Иконки навигации из эмодзи одним проходом: шрифт, кисть и перо общие для всех.
+
+    Готовые иконки кэшируются на модуль — QIcon можно делить между виджетами.
+    """
+    missing = [emoji for emoji in dict.fromkeys(emojis) if emoji not in _NAV_ICONS]
+    if missing:
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        background = QtGui.QBrush(QtGui.QColor("#1f2937"))
+        no_pen = QtGui.QPen(QtCore.Qt.PenStyle.NoPen)
+        text_pen = QtGui.QPen(QtGui.QColor("#e5e7eb"))
+        rect = QtCore.QRect(0, 0, 32, 32)
+        for emoji in missing:
+            pixmap = QtGui.QPixmap(32, 32)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            painter.setPen(no_pen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(rect, 8, 8)
+            painter.setPen(text_pen)
+            painter.setFont(font)
+            painter.drawText(rect, QtCore.Qt.AlignmentFlag.AlignCenter, emoji)
+            painter.end()
+            _NAV_ICONS[emoji] = QtGui.QIcon(pixmap)
+    return {emoji: _NAV_ICONS[emoji] for emoji in emojis}
+
+
+@lru_cache(maxsize=32)
+def _emoji_pixmap(emoji: str, size: int = 18) -> QtGui.QPixmap:
+    """Эмодзи, заранее отрисованный в pixmap: подписи статуса остаются чистым текстом."""
+    pixmap = QtGui.QPixmap(size, size)
+    pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+    painter = QtGui.QPainter(pixmap)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    font = painter.font()
+    font.setPixelSize(size - 4)
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, emoji)
+    painter.end()
+    return pixmap
+
+
+@lru_cache(maxsize=32)
+def _build_icon(text: str) -> QtGui.QIcon:
+    """Иконка приложения с текстом (окно, трей)."""
+    pixmap = QtGui.QPixmap(128, 128)
+    pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+    painter = QtGui.QPainter(pixmap)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QtGui.QColor("#2563eb"))
+    painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.transparent))
+    painter.drawRoundedRect(0, 0, 128, 128, 28, 28)
+    painter.setPen(QtGui.QPen(QtGui.QColor("#e5e7eb")))
+    font = painter.font()
+    font.setBold(True)
+    font.setPointSize(46)
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    return QtGui.QIcon(pixmap)
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """Главное окно приложения c навигацией и статусом устройства."""
 
+    # поток озвучки сообщает о недоступном драйвере речи; слот выполняется в GUI-потоке
+    _ttsFailed = QtCore.pyqtSignal()
+
     def __init__(self, config: Optional[ConfigManager] = None, manager: Optional[SensorManager] = None) -> None:
         super().__init__()
         # Отключаем спам qt.text.emojisegmenter
@@ -52,21 +141,62 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("Callibri Control")
         self.resize(1280, 820)
         self.setMinimumSize(1100, 720)
-        self.setWindowIcon(self._build_icon("CC"))
+        self.setWindowIcon(_build_icon("CC"))
         self.setUnifiedTitleAndToolBarOnMac(True)
 
         self._nav_buttons: Dict[str, QtWidgets.QToolButton] = {}
         self._pages: Dict[str, QtWidgets.QWidget] = {}
+        self._page_on_show: Dict[str, Optional[Callable[[], None]]] = {}
+        self._page_on_tick: Dict[str, Callable[[int], None]] = {}  # демо-тики созданных страниц
         self._is_sidebar_collapsed = False
         self._session_timer = QtCore.QElapsedTimer()
         self._session_timer.start()
         self._streaming_active = False
-        self._emg_peak = 0.1
+        # baseline/диапазон EMG для нормализации; обновляются по сигналу bridge.thresholdsChanged
+        self._emg_baseline = 0.0
+        self._emg_span = 0.1
+        # тему и профиль читаем из конфига один раз; дальше их ведут _apply_theme/_set_profile
+        self._theme = self._theme_from_config()
         self._control_profile = (
             self.config.config.get("control", {}).get("profile", "DEFAULT") if self.config else "DEFAULT"
         )
         self.hud: Optional[HudOverlay] = None
         self._hud_visible = False
+        # Озвучка: один поток и один движок pyttsx3 на всё время работы, фразы — через очередь.
+        # Поток стартует сразу, так что инициализация драйвера речи проходит, пока пользователь
+        # ещё ничего не делает; ui.tts.enabled = false не загружает драйвер вовсе.
+        self._tts_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        tts_cfg = self.config.config.get("ui", {}).get("tts", {}) if self.config else {}
+        self._tts_available = bool(tts_cfg.get("enabled", True)) if isinstance(tts_cfg, dict) else True
+        if self._tts_available:
+            self._ttsFailed.connect(self._on_tts_failed, QtCore.Qt.ConnectionType.QueuedConnection)
+            # любой выход (закрытие окна, «Выход» в трее, QApplication.quit) проходит через aboutToQuit
+            QtWidgets.QApplication.instance().aboutToQuit.connect(self._stop_tts)
+            threading.Thread(target=self._tts_loop, name="tts", daemon=True).start()
+        # Живые данные от bridge копим и выводим не чаще ~60 Гц (одна перерисовка виджетов на кадр)
+        self._live_emg: List[float] = []
+        self._live_roll: List[float] = []
+        self._live_muscle: Optional[float] = None
+        self._live_orientation: Optional[Tuple[float, float, float]] = None
+        self._live_timer = QtCore.QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(16)
+        self._live_timer.timeout.connect(self._flush_live)
+        # точки для графиков скрытых страниц: рисуем только видимую, остальные догоняют при показе
+        self._plot_backlog: Dict[QtWidgets.QWidget, Deque[float]] = {}
+        # мёртвая зона для виджета ориентации: шум неподвижного датчика не перерисовывает его
+        self._ori_eps = 0.25  # градусы
+        self._last_ori: Optional[Tuple[float, float, float]] = None  # последний показанный угол
+        # Один эффект прозрачности и одна анимация на все страницы: эффект переносится на
+        # показываемую страницу и выключается по окончании, чтобы не рисовать её через offscreen-буфер
+        self._fade_effect = QtWidgets.QGraphicsOpacityEffect()
+        self._fade_effect.setEnabled(False)
+        self._fade_anim = QtCore.QPropertyAnimation(self._fade_effect, b"opacity", self)
+        self._fade_anim.setDuration(200)
+        self._fade_anim.setStartValue(0.0)
+        self._fade_anim.setEndValue(1.0)
+        self._fade_anim.setEasingCurve(QtCore.QEasingCurve.Type.InOutQuad)
+        self._fade_anim.finished.connect(lambda: self._fade_effect.setEnabled(False))
 
         self._status = {
             "device": "Не подключено",
@@ -74,10 +204,14 @@ class MainWindow(QtWidgets.QMainWindow):
             "state": "Готов",
             "fatigue": 0,
         }
+        # батарея/усталость приходят с каждым шагом bridge — выводим их раз в секунду вместе с таймером
+        self._status_dirty = False
+        self._last_session_text = ""
+        self._current_qss = ""
 
         self._create_ui()
         self._create_tray()
-        self._apply_theme(self._theme_from_config())
+        self._apply_theme(self._theme)
         self._setup_shortcuts()
 
     # UI ------------------------------------------------------------------
@@ -117,9 +251,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self._tick_timer.timeout.connect(self._tick_status)
         self._tick_timer.start(1000)
 
+        # Один таймер на все демо-анимации: страницы и их виджеты обновляются прямыми вызовами
+        # в одном тике, без собственных таймеров и разнесённых во времени перерисовок
+        self._demo_phase = 0
+        self._demo_tick = QtCore.QTimer(self)
+        self._demo_tick.setInterval(33)
+        self._demo_tick.timeout.connect(self._broadcast_tick)  # запускается в showEvent
+
     def _build_header(self) -> QtWidgets.QWidget:
         frame = QtWidgets.QFrame()
         frame.setObjectName("Header")
+        frame.setProperty("glass", True)
         layout = QtWidgets.QHBoxLayout(frame)
         layout.setContentsMargins(14, 10, 14, 10)
         layout.setSpacing(10)
@@ -132,7 +274,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.theme_toggle = QtWidgets.QComboBox()
         self.theme_toggle.addItems(["dark", "light", "contrast"])
-        self.theme_toggle.setCurrentText(self._theme_from_config())
+        self.theme_toggle.setCurrentText(self._theme)
         self.theme_toggle.currentTextChanged.connect(self._apply_theme)
         self.theme_toggle.setToolTip("Тема интерфейса")
         layout.addWidget(self._labeled_wrap("🎨", self.theme_toggle))
@@ -155,6 +297,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _build_sidebar(self) -> QtWidgets.QFrame:
         frame = QtWidgets.QFrame()
         frame.setObjectName("Sidebar")
+        frame.setProperty("glass", True)
         frame.setMinimumWidth(220)
         frame.setMaximumWidth(220)
         layout = QtWidgets.QVBoxLayout(frame)
@@ -173,17 +316,22 @@ class MainWindow(QtWidgets.QMainWindow):
             ("analytics", "📊", "Аналитика", AnalyticsPage),
             ("settings", "⚙️", "Настройки", SettingsPage),
         ]
-        for key, icon, title, _cls in items:
+        # одна эксклюзивная группа и одно соединение вместо лямбды на каждую кнопку
+        self._nav_group = QtWidgets.QButtonGroup(self)
+        self._nav_group.setExclusive(True)
+        self._nav_keys = [key for key, _icon, _title, _cls in items]
+        icons = _build_nav_icons([icon for _key, icon, _title, _cls in items])
+        for idx, (key, icon, title, _cls) in enumerate(items):
             btn = QtWidgets.QToolButton()
             btn.setObjectName("NavButton")
-            btn.setText(f"{icon}  {title}")
-            btn.setIcon(self._emoji_icon(icon))
+            btn.setText(title)  # эмодзи уже нарисован в иконке
+            btn.setIcon(icons[icon])
             btn.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
             btn.setCheckable(True)
-            btn.setAutoExclusive(True)
-            btn.clicked.connect(lambda _=False, page=key: self._switch_page(page))
+            self._nav_group.addButton(btn, idx)
             layout.addWidget(btn)
             self._nav_buttons[key] = btn
+        self._nav_group.idClicked.connect(lambda idx: self._switch_page(self._nav_keys[idx]))
 
         layout.addStretch()
         return frame
@@ -191,93 +339,135 @@ class MainWindow(QtWidgets.QMainWindow):
     def _build_statusbar(self) -> QtWidgets.QFrame:
         frame = QtWidgets.QFrame()
         frame.setObjectName("StatusBar")
+        frame.setProperty("glass", True)
         layout = QtWidgets.QHBoxLayout(frame)
         layout.setContentsMargins(14, 8, 14, 8)
         layout.setSpacing(20)
 
-        self.device_label = QtWidgets.QLabel("🔌 Не подключено")
-        self.battery_label = QtWidgets.QLabel("🔋 —")
-        self.state_label = QtWidgets.QLabel("💪 Готов")
-        self.session_label = QtWidgets.QLabel("⏱️ 00:00:00")
-        self.fatigue_label = QtWidgets.QLabel("🟢 Усталость: 0%")
-
-        for widget in (
-            self.device_label,
-            self.battery_label,
-            self.state_label,
-            self.session_label,
-            self.fatigue_label,
-        ):
-            widget.setObjectName("StatusLabel")
-            layout.addWidget(widget)
+        # эмодзи — готовый pixmap слева, в QLabel обновляется только текст
+        self.device_label = self._status_item(layout, "🔌", "Не подключено")
+        self.battery_label = self._status_item(layout, "🔋", "—")
+        self.state_label = self._status_item(layout, "💪", "Готов")
+        self.session_label = self._status_item(layout, "⏱️", "00:00:00")
+        self.fatigue_label = self._status_item(layout, "🟢", "Усталость: 0%")
 
         layout.addStretch()
         return frame
 
+    def _status_item(self, layout: QtWidgets.QHBoxLayout, emoji: str, text: str) -> QtWidgets.QLabel:
+        icon = QtWidgets.QLabel()
+        icon.setObjectName("StatusLabel")
+        icon.setPixmap(_emoji_pixmap(emoji))
+        label = QtWidgets.QLabel(text)
+        label.setObjectName("StatusLabel")
+        item = QtWidgets.QHBoxLayout()
+        item.setSpacing(6)
+        item.addWidget(icon)
+        item.addWidget(label)
+        layout.addLayout(item)
+        return label
+
     def _populate_pages(self) -> None:
-        pages = {
-            "dashboard": DashboardPage(),
-            "control": ControlPage(),
-            "training": TrainingPage(),
-            "games": GamesPage(),
-            "analytics": AnalyticsPage(),
-            "settings": SettingsPage(self.theme_toggle),
+        # Страницы создаются при первом открытии: на старте строится только главная,
+        # остальные не держат виджеты и демо-таймеры, пока их не откроют
+        self._page_factories: Dict[str, Callable[[], QtWidgets.QWidget]] = {
+            "dashboard": DashboardPage,
+            "control": ControlPage,
+            "training": TrainingPage,
+            "games": GamesPage,
+            "analytics": AnalyticsPage,
+            "settings": lambda: SettingsPage(self.theme_toggle),
         }
-        for name, widget in pages.items():
-            self._pages[name] = widget
-            self.stack.addWidget(widget)
 
         # выбрать главную страницу
-        self._nav_buttons["dashboard"].setChecked(True)
         self._switch_page("dashboard")
         self._apply_shadows()
-        self._apply_glass()
 
+    def _ensure_page(self, name: str) -> Optional[QtWidgets.QWidget]:
+        widget = self._pages.get(name)
+        if widget is not None:
+            return widget
+        factory = self._page_factories.get(name)
+        if factory is None:
+            return None
+        widget = factory()
+        self._pages[name] = widget
+        # хук on_show (если есть) находим один раз при создании страницы
+        self._page_on_show[name] = getattr(widget, "on_show", None)
+        on_tick = getattr(widget, "on_tick", None)
+        if on_tick is not None:
+            self._page_on_tick[name] = on_tick
+        self.stack.addWidget(widget)
+        if name == "dashboard":
+            self._wire_dashboard(widget)  # type: ignore[arg-type]
+        elif name == "control":
+            self._wire_control(widget)  # type: ignore[arg-type]
+        if self._streaming_active and hasattr(widget, "set_demo"):
+            widget.set_demo(False)
+        return widget
+
+    def _wire_dashboard(self, dash: DashboardPage) -> None:
         # Кнопки быстрого доступа
-        dash: DashboardPage = self._pages["dashboard"]  # type: ignore[assignment]
         dash.start_btn.clicked.connect(self.toggle_control)
         dash.games_btn.clicked.connect(lambda: self._switch_page("games"))
         dash.training_btn.clicked.connect(lambda: self._switch_page("training"))
         dash.profiles_btn.clicked.connect(lambda: self._switch_page("settings"))
         dash.calibrate_btn.clicked.connect(self._recalibrate)
-        ctrl: ControlPage = self._pages["control"]  # type: ignore[assignment]
+
+    def _wire_control(self, ctrl: ControlPage) -> None:
         ctrl.set_profile_options(sorted(DEFAULT_MAPPINGS.keys()), self._control_profile)
         ctrl.profile_combo.currentTextChanged.connect(self._set_profile)
 
     # Status / theme ------------------------------------------------------
     def update_status(self, *, device: Optional[str] = None, battery: Optional[int] = None, state: Optional[str] = None, fatigue: Optional[int] = None) -> None:
         """Обновить отображаемый статус (используется ядром приложения)."""
+        # смену устройства или состояния показываем сразу, остальное — на ближайшем тике
+        immediate = False
         if device is not None:
+            immediate |= device != self._status["device"]
             self._status["device"] = device
         if battery is not None:
             self._status["battery"] = max(0, min(100, battery))
         if state is not None:
+            immediate |= state != self._status["state"]
             self._status["state"] = state
         if fatigue is not None:
             self._status["fatigue"] = max(0, min(100, fatigue))
-        self._render_status()
+        if immediate:
+            self._render_status()
+        else:
+            self._status_dirty = True
 
     def _render_status(self) -> None:
-        self.device_label.setText(f"🔌 {self._status['device']}")
-        self.battery_label.setText(f"🔋 {self._status['battery']}%")
-        self.state_label.setText(f"💪 {self._status['state']}")
-        self.fatigue_label.setText(f"🟢 Усталость: {self._status['fatigue']}%")
+        self._status_dirty = False
+        self.device_label.setText(str(self._status["device"]))
+        self.battery_label.setText(f"{self._status['battery']}%")
+        self.state_label.setText(str(self._status["state"]))
+        self.fatigue_label.setText(f"Усталость: {self._status['fatigue']}%")
+
+    def _broadcast_tick(self) -> None:
+        self._demo_phase += 1
+        for on_tick in self._page_on_tick.values():
+            on_tick(self._demo_phase)
 
     def _tick_status(self) -> None:
-        elapsed_ms = self._session_timer.elapsed()
-        hours = int(elapsed_ms / 3600000)
-        minutes = int((elapsed_ms % 3600000) / 60000)
-        seconds = int((elapsed_ms % 60000) / 1000)
-        self.session_label.setText(f"⏱️ {hours:02d}:{minutes:02d}:{seconds:02d}")
+        minutes, seconds = divmod(self._session_timer.elapsed() // 1000, 60)
+        hours, minutes = divmod(minutes, 60)
+        text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        # тик таймера может прийти дважды в одну секунду — не трогаем layout зря
+        if text != self._last_session_text:
+            self._last_session_text = text
+            self.session_label.setText(text)
+        if self._status_dirty:
+            self._render_status()
 
     def _apply_theme(self, theme: str) -> None:
         theme = theme.lower()
-        qss_path = Path(__file__).resolve().parent / "styles" / f"{theme}_theme.qss"
-        if qss_path.exists():
-            qss = qss_path.read_text(encoding="utf-8")
-            self.setStyleSheet(qss)
-        else:
-            self.setStyleSheet("")
+        self._theme = theme
+        self._current_qss = _load_qss(theme)
+        self.setStyleSheet(self._current_qss)
+        if self.hud is not None:
+            self.hud.setStyleSheet(self._current_qss)
         if self.config:
             try:
                 self.config.set_config_value("ui.theme", theme)
@@ -294,18 +484,23 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # Navigation / tray ---------------------------------------------------
     def _switch_page(self, name: str) -> None:
-        widget = self._pages.get(name)
+        widget = self._ensure_page(name)
         if widget is None:
             return
         self.stack.setCurrentWidget(widget)
         self._fade_in(widget)
-        if name in self._nav_buttons:
-            self._nav_buttons[name].setChecked(True)
-        if hasattr(widget, "on_show"):
+        if any(self._plot_backlog.values()):
+            self._schedule_live()
+        # при клике кнопка уже отмечена группой; выставляем только при программном переключении
+        button = self._nav_buttons.get(name)
+        if button is not None and not button.isChecked():
+            button.setChecked(True)
+        on_show = self._page_on_show.get(name)
+        if on_show is not None:
             try:
-                widget.on_show()
+                on_show()
             except Exception:
-                pass
+                LOGGER.exception("on_show страницы %s завершился ошибкой", name)
 
     def _toggle_sidebar(self) -> None:
         self._is_sidebar_collapsed = not self._is_sidebar_collapsed
@@ -341,6 +536,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tray.setContextMenu(menu)
         self.tray.show()
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+        self._demo_tick.start()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:  # noqa: N802
+        # окно в трее: демо-анимации некому показывать
+        super().hideEvent(event)
+        self._demo_tick.stop()
+
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802
         """По умолчанию — прячем окно в трей, чтобы управление продолжало работать."""
         if self.tray and self.tray.isVisible():
@@ -351,39 +555,6 @@ class MainWindow(QtWidgets.QMainWindow):
             super().closeEvent(event)
 
     # Helpers -------------------------------------------------------------
-    def _emoji_icon(self, emoji: str) -> QtGui.QIcon:
-        pixmap = QtGui.QPixmap(32, 32)
-        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.setPen(QtCore.Qt.GlobalColor.transparent)
-        painter.setBrush(QtGui.QColor("#1f2937"))
-        painter.drawRoundedRect(0, 0, 32, 32, 8, 8)
-        painter.setPen(QtGui.QPen(QtGui.QColor("#e5e7eb")))
-        font = painter.font()
-        font.setPointSize(14)
-        painter.setFont(font)
-        painter.drawText(pixmap.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, emoji)
-        painter.end()
-        return QtGui.QIcon(pixmap)
-
-    def _build_icon(self, text: str) -> QtGui.QIcon:
-        pixmap = QtGui.QPixmap(128, 128)
-        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QtGui.QColor("#2563eb"))
-        painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.transparent))
-        painter.drawRoundedRect(0, 0, 128, 128, 28, 28)
-        painter.setPen(QtGui.QPen(QtGui.QColor("#e5e7eb")))
-        font = painter.font()
-        font.setBold(True)
-        font.setPointSize(46)
-        painter.setFont(font)
-        painter.drawText(pixmap.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, text)
-        painter.end()
-        return QtGui.QIcon(pixmap)
-
     def _labeled_wrap(self, prefix: str, widget: QtWidgets.QWidget) -> QtWidgets.QFrame:
         wrapper = QtWidgets.QFrame()
         layout = QtWidgets.QHBoxLayout(wrapper)
@@ -398,24 +569,18 @@ class MainWindow(QtWidgets.QMainWindow):
         """Отключено: тени иногда вызывают баги QPainter на некоторых системах."""
         return
 
-    def _apply_glass(self) -> None:
-        """Помечает карточки как «стекло», чтобы QSS дал полупрозрачный фон/blur."""
-        for frame in self.findChildren(QtWidgets.QFrame):
-            if frame.objectName() in {"Card", "Header", "Sidebar", "StatusBar"}:
-                frame.setProperty("glass", True)
-
     def _fade_in(self, widget: QtWidgets.QWidget) -> None:
         """Лёгкая анимация появления страниц для «премиум» ощущения."""
-        effect = QtWidgets.QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(effect)
-        anim = QtCore.QPropertyAnimation(effect, b"opacity", self)
-        anim.setDuration(200)
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-        anim.setEasingCurve(QtCore.QEasingCurve.Type.InOutQuad)
-        anim.start(QtCore.QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        self._fade_anim.stop()
+        if widget.graphicsEffect() is not self._fade_effect:
+            # setGraphicsEffect снимает эффект с предыдущей страницы, не удаляя его
+            widget.setGraphicsEffect(self._fade_effect)
+        self._fade_effect.setOpacity(0.0)
+        self._fade_effect.setEnabled(True)
+        self._fade_anim.start()
 
     def _set_demo(self, enabled: bool) -> None:
+        self._last_ori = None  # после демо первый реальный угол показываем без мёртвой зоны
         dash: DashboardPage = self._pages.get("dashboard")  # type: ignore[assignment]
         control: ControlPage = self._pages.get("control")  # type: ignore[assignment]
         if dash:
@@ -426,8 +591,8 @@ class MainWindow(QtWidgets.QMainWindow):
     def _toggle_hud(self, checked: bool) -> None:
         if self.hud is None:
             self.hud = HudOverlay()
-            # применяем стиль текущей темы
-            self.hud.setStyleSheet(self.styleSheet())
+            # HUD — отдельное окно и не наследует QSS главного; дальше тему обновляет _apply_theme
+            self.hud.setStyleSheet(self._current_qss)
         self._hud_visible = checked
         if checked:
             self.hud.show()
@@ -455,6 +620,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.bridge.accMagnitude.connect(self._on_acc_mag)
             self.bridge.gestureDetected.connect(self._on_gesture)
             self.bridge.fatigueIndex.connect(self._on_fatigue)
+            self.bridge.thresholdsChanged.connect(self._on_thresholds)
+            self._on_thresholds(self.bridge.thresholds.baseline, self.bridge.thresholds.mvc)
             self.bridge.set_control_profile(self._control_profile)
         self.bridge.start()
         self._set_demo(False)
@@ -497,27 +664,61 @@ class MainWindow(QtWidgets.QMainWindow):
         self.update_status(device=self._status["device"], battery=battery, state=text)
 
     def _on_emg(self, rms: float) -> None:
-        baseline = 0.0
-        span = self._emg_peak or 1e-3
-        if self.bridge:
-            baseline = getattr(self.bridge.thresholds, "baseline", 0.0)
-            span = max(getattr(self.bridge.thresholds, "mvc", 0.1) - baseline, 1e-3)
-        self._emg_peak = max(self._emg_peak * 0.995, rms + 1e-6)
-        normalized = max(0.0, min((rms - baseline) / span, 1.2))
-        dashboard: DashboardPage = self._pages.get("dashboard")  # type: ignore[assignment]
-        control: ControlPage = self._pages.get("control")  # type: ignore[assignment]
-        dashboard.muscle_bar.set_value(normalized)
-        control.muscle_bar.set_value(normalized)
-        dashboard.emg_plot.append_point(rms)
-        control.emg_plot.append_point(rms)
-        if self.hud and self._hud_visible:
-            self.hud.update_muscle(normalized)
+        self._live_muscle = max(0.0, min((rms - self._emg_baseline) / self._emg_span, 1.2))
+        self._live_emg.append(rms)
+        self._schedule_live()
+
+    def _on_thresholds(self, baseline: float, mvc: float) -> None:
+        self._emg_baseline = baseline
+        self._emg_span = max(mvc - baseline, 1e-3)
 
     def _on_orientation(self, pitch: float, roll: float, yaw: float) -> None:
+        self._live_roll.append(roll)
+        last = self._last_ori
+        if last is None or max(abs(pitch - last[0]), abs(roll - last[1]), abs(yaw - last[2])) >= self._ori_eps:
+            self._live_orientation = (pitch, roll, yaw)
+        self._schedule_live()
+
+    def _schedule_live(self) -> None:
+        if not self._live_timer.isActive():
+            self._live_timer.start()
+
+    def _flush_live(self) -> None:
+        """Применяет накопленные за кадр EMG/MEMS данные: графики получают все точки, индикаторы — последнее значение."""
         dashboard: DashboardPage = self._pages.get("dashboard")  # type: ignore[assignment]
         control: ControlPage = self._pages.get("control")  # type: ignore[assignment]
-        dashboard.orientation.set_orientation(pitch, roll, yaw)
-        control.tilt_plot.append_point(roll)
+        emg, self._live_emg = self._live_emg, []
+        roll, self._live_roll = self._live_roll, []
+        current = self.stack.currentWidget()
+        if emg:
+            normalized = self._live_muscle
+            dashboard.muscle_bar.set_value(normalized)
+            if control:
+                control.muscle_bar.set_value(normalized)
+            if self.hud and self._hud_visible:
+                self.hud.update_muscle(normalized)
+        if self._live_orientation is not None:
+            dashboard.orientation.set_orientation(*self._live_orientation)
+            self._last_ori = self._live_orientation
+            self._live_orientation = None
+        self._feed_plot(dashboard is current, dashboard.emg_plot, emg)
+        if control:
+            self._feed_plot(control is current, control.emg_plot, emg)
+            self._feed_plot(control is current, control.tilt_plot, roll)
+
+    def _feed_plot(self, visible: bool, plot: SignalPlot, values: List[float]) -> None:
+        backlog = self._plot_backlog.get(plot)
+        if not visible:
+            if values:
+                if backlog is None:
+                    backlog = self._plot_backlog[plot] = deque(maxlen=plot.max_points)
+                backlog.extend(values)
+            return
+        if backlog:
+            plot.extend(backlog)
+            backlog.clear()
+        if values:
+            plot.extend(values)
 
     def _on_acc_mag(self, mag: float) -> None:
         # Дополнительный индикатор активности MEMS (shake) можно подсвечивать позже
@@ -531,13 +732,14 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.hud and self._hud_visible:
             self.hud.update_fatigue(fatigue)
 
-    def _on_gesture(self, event: dict) -> None:
-        name = event.get("type", "GESTURE")
-        confidence = float(event.get("value", 0.0) or 0.0)
+    def _on_gesture(self, event: GestureEvent) -> None:
+        name = event.type
+        confidence = float(event.value)
         dashboard: DashboardPage = self._pages.get("dashboard")  # type: ignore[assignment]
         control: ControlPage = self._pages.get("control")  # type: ignore[assignment]
         dashboard.gesture_indicator.set_gesture(str(name), confidence=confidence if confidence <= 1 else min(confidence / 10.0, 1.0))
-        control.add_gesture_event(str(name), confidence if confidence <= 1 else min(confidence / 10.0, 1.0))
+        if control:
+            control.add_gesture_event(str(name), confidence if confidence <= 1 else min(confidence / 10.0, 1.0))
         # Озвучка на двойном/тройном флексе
         if name in {"DOUBLE_FLEX", "TRIPLE_FLEX"}:
             self.announce(f"{name.replace('_', ' ').title()}")
@@ -558,26 +760,47 @@ class MainWindow(QtWidgets.QMainWindow):
     def _set_start_button_text(self, text: str) -> None:
         dashboard: DashboardPage = self._pages.get("dashboard")  # type: ignore[assignment]
         if hasattr(dashboard, "start_btn"):
-            dashboard.start_btn.setText(text)
-            if text == "Стоп":
-                dashboard.start_btn.setObjectName("PrimaryButton")
-            dashboard.start_btn.repaint()
+            btn = dashboard.start_btn
+            btn.setText(text)  # setText сам планирует перерисовку
+            if text == "Стоп" and btn.objectName() != "PrimaryButton":
+                # селектор QSS сменился — переполировать, без синхронного repaint()
+                btn.setObjectName("PrimaryButton")
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+                btn.update()
 
     # Voice ----------------------------------------------------------------
     def announce(self, text: str) -> None:
-        def _speak(msg: str) -> None:
-            try:
-                import pyttsx3
+        if self._tts_available:
+            self._tts_queue.put(text)
+
+    def _on_tts_failed(self) -> None:
+        self._tts_available = False
+
+    def _stop_tts(self) -> None:
+        self._tts_available = False
+        self._tts_queue.put(None)
+
+    def _tts_loop(self) -> None:
+        try:
+            import pyttsx3
 
-                engine = pyttsx3.init()
-                engine.setProperty("rate", 180)
+            engine = pyttsx3.init()
+            engine.setProperty("rate", 180)
+        except Exception:
+            # нет pyttsx3/драйвера речи — озвучка просто отключается
+            self._ttsFailed.emit()
+            return
+        while True:
+            msg = self._tts_queue.get()
+            if msg is None:
+                break
+            try:
                 engine.say(msg)
                 engine.runAndWait()
             except Exception:
                 pass
 
-        threading.Thread(target=_speak, args=(text,), daemon=True).start()
-
 
 def run_gui(config: Optional[ConfigManager] = None, manager: Optional[SensorManager] = None) -> int:
     """Точка входа для GUI режима (используется из main.py)."""
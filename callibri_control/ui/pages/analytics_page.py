@@ -5,7 +5,7 @@ from __future__ import annotations
 import random
 from typing import Optional
 
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtWidgets
 
 from callibri_control.ui.widgets import SignalPlot
 
@@ -15,9 +15,6 @@ class AnalyticsPage(QtWidgets.QWidget):
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
-        self._demo_timer = QtCore.QTimer(self)
-        self._demo_timer.timeout.connect(self._tick_demo)
-        self._demo_timer.start(120)
         self._build_layout()
 
     def _build_layout(self) -> None:
@@ -54,6 +51,7 @@ class AnalyticsPage(QtWidgets.QWidget):
     def _stat_card(self, title: str, value: str) -> QtWidgets.QWidget:
         card = QtWidgets.QFrame()
         card.setObjectName("Card")
+        card.setProperty("glass", True)
         vbox = QtWidgets.QVBoxLayout(card)
         vbox.setContentsMargins(12, 12, 12, 12)
         vbox.setSpacing(4)
@@ -68,6 +66,7 @@ class AnalyticsPage(QtWidgets.QWidget):
     def _chart_wrap(self, title: str, plot: QtWidgets.QWidget) -> QtWidgets.QWidget:
         frame = QtWidgets.QFrame()
         frame.setObjectName("Card")
+        frame.setProperty("glass", True)
         vbox = QtWidgets.QVBoxLayout(frame)
         vbox.setContentsMargins(12, 12, 12, 12)
         vbox.setSpacing(6)
@@ -75,6 +74,13 @@ class AnalyticsPage(QtWidgets.QWidget):
         vbox.addWidget(plot)
         return frame
 
-    def _tick_demo(self) -> None:
-        self.usage_plot.append_point(random.uniform(0.3, 1.0))
-        self.fatigue_plot.append_point(random.uniform(0.2, 0.9))
+    def on_tick(self, phase: int) -> None:
+        """Общий демо-тик окна (~33 мс): раз в 8 тиков и только пока страница на экране."""
+        if phase % 8 or not self.isVisible():
+            return
+        for plot in (self.usage_plot, self.fatigue_plot):
+            plot.tick_demo()
+        self.usage_plot.append_point_nodraw(random.uniform(0.3, 1.0))
+        self.fatigue_plot.append_point_nodraw(random.uniform(0.2, 0.9))
+        self.usage_plot.flush()
+        self.fatigue_plot.flush()
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import random
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 
 from PyQt6 import QtCore, QtWidgets
 
 from callibri_control.ui.widgets import GestureIndicator, MuscleBar, SignalPlot
+from callibri_control.utils.helpers import NoiseBuffer
 
 
 class ControlPage(QtWidgets.QWidget):
@@ -15,10 +16,8 @@ class ControlPage(QtWidgets.QWidget):
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
-        self._demo_timer = QtCore.QTimer(self)
-        self._demo_timer.timeout.connect(self._tick_demo)
-        self._demo_timer.start(70)
-        self._demo_enabled = True
+        self._noise = NoiseBuffer()  # случайные числа для демо-тиков
+        self._demo_enabled = True  # демо тикает общий таймер окна через on_tick
         self._build_layout()
 
     def _build_layout(self) -> None:
@@ -29,6 +28,7 @@ class ControlPage(QtWidgets.QWidget):
         # Левая колонка — графики
         left = QtWidgets.QFrame()
         left.setObjectName("Card")
+        left.setProperty("glass", True)
         left_layout = QtWidgets.QVBoxLayout(left)
         left_layout.setContentsMargins(12, 12, 12, 12)
         left_layout.setSpacing(10)
@@ -45,6 +45,7 @@ class ControlPage(QtWidgets.QWidget):
         # Центральная колонка — жесты
         center = QtWidgets.QFrame()
         center.setObjectName("Card")
+        center.setProperty("glass", True)
         center_layout = QtWidgets.QVBoxLayout(center)
         center_layout.setContentsMargins(12, 12, 12, 12)
         center_layout.setSpacing(8)
@@ -53,7 +54,13 @@ class ControlPage(QtWidgets.QWidget):
         center_layout.addWidget(self.gesture_indicator)
 
         center_layout.addWidget(QtWidgets.QLabel("Последние жесты"))
-        self.gesture_list = QtWidgets.QListWidget()
+        # последние жесты: deque + модель строк, на событие — одна замена списка вместо insert/take
+        self._gesture_items: Deque[str] = deque(maxlen=30)
+        self._gesture_model = QtCore.QStringListModel(self)
+        self.gesture_list = QtWidgets.QListView()
+        self.gesture_list.setModel(self._gesture_model)
+        self.gesture_list.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.gesture_list.setUniformItemSizes(True)
         self.gesture_list.setObjectName("List")
         center_layout.addWidget(self.gesture_list, 1)
         layout.addWidget(center, 2)
@@ -61,6 +68,7 @@ class ControlPage(QtWidgets.QWidget):
         # Правая колонка — профили и пороги
         right = QtWidgets.QFrame()
         right.setObjectName("Card")
+        right.setProperty("glass", True)
         right_layout = QtWidgets.QVBoxLayout(right)
         right_layout.setContentsMargins(12, 12, 12, 12)
         right_layout.setSpacing(10)
@@ -89,9 +97,10 @@ class ControlPage(QtWidgets.QWidget):
     # Updates -------------------------------------------------------------
     def add_gesture_event(self, gesture: str, confidence: float) -> None:
         self.gesture_indicator.set_gesture(gesture, confidence)
-        self.gesture_list.insertItem(0, f"{gesture} • {confidence*100:.0f}%")
-        if self.gesture_list.count() > 30:
-            self.gesture_list.takeItem(self.gesture_list.count() - 1)
+        self._gesture_items.appendleft(f"{gesture} • {confidence*100:.0f}%")
+        self.gesture_list.setUpdatesEnabled(False)
+        self._gesture_model.setStringList(list(self._gesture_items))
+        self.gesture_list.setUpdatesEnabled(True)
 
     def set_profile_options(self, profiles: list[str], active: str) -> None:
         self.profile_combo.blockSignals(True)
@@ -104,20 +113,21 @@ class ControlPage(QtWidgets.QWidget):
 
     def set_demo(self, enabled: bool) -> None:
         self._demo_enabled = enabled
-        if enabled:
-            if not self._demo_timer.isActive():
-                self._demo_timer.start(70)
-        else:
-            self._demo_timer.stop()
 
     # Demo ----------------------------------------------------------------
-    def _tick_demo(self) -> None:
-        if not self._demo_enabled:
+    def on_tick(self, phase: int) -> None:
+        """Общий демо-тик окна (~33 мс); страница обновляется на каждом втором и только на экране."""
+        if not self._demo_enabled or phase % 2 or not self.isVisible():
             return
-        self.emg_plot.append_point(0.4 + random.uniform(-0.2, 0.4))
-        self.tilt_plot.append_point(random.uniform(-1.0, 1.0))
-        self.muscle_bar.set_value(random.uniform(0.2, 0.9))
-        if random.random() > 0.92:
-            gesture = random.choice(["MUSCLE_FLEX", "DOUBLE_FLEX", "TILT_LEFT", "TILT_UP"])
-            conf = random.uniform(0.6, 0.95)
+        # точки кладём без перерисовки, графики обновляются одним flush в конце тика
+        self.emg_plot.tick_demo()
+        self.tilt_plot.tick_demo()
+        self.emg_plot.append_point_nodraw(0.4 + self._noise.uniform(-0.2, 0.4))
+        self.tilt_plot.append_point_nodraw(self._noise.uniform(-1.0, 1.0))
+        self.muscle_bar.set_value(self._noise.uniform(0.2, 0.9))
+        if self._noise.random() > 0.92:
+            gesture = self._noise.choice(["MUSCLE_FLEX", "DOUBLE_FLEX", "TILT_LEFT", "TILT_UP"])
+            conf = self._noise.uniform(0.6, 0.95)
             self.add_gesture_event(gesture, conf)
+        self.emg_plot.flush()
+        self.tilt_plot.flush()
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import random
 from typing import Optional
 
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtWidgets
 
 from callibri_control.ui.widgets import FatigueGauge, GestureIndicator, MuscleBar, SignalPlot, OrientationVisualizer
+from callibri_control.utils.helpers import NoiseBuffer
 
 
 class DashboardPage(QtWidgets.QWidget):
@@ -15,13 +15,11 @@ class DashboardPage(QtWidgets.QWidget):
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
+        self._noise = NoiseBuffer()  # случайные числа для демо-тиков
         self._device_info = {"name": "Не подключено", "serial": "—", "fw": "—", "battery": 0}
         self._state = "Готов"
         self._fatigue = 0
-        self._demo_timer = QtCore.QTimer(self)
-        self._demo_timer.timeout.connect(self._tick_demo)
-        self._demo_enabled = True
-        self._demo_timer.start(80)
+        self._demo_enabled = True  # демо тикает общий таймер окна через on_tick
         self._demo_phase = 0.0
 
         self._build_layout()
@@ -44,6 +42,7 @@ class DashboardPage(QtWidgets.QWidget):
     def _device_card(self) -> QtWidgets.QWidget:
         card = QtWidgets.QFrame()
         card.setObjectName("Card")
+        card.setProperty("glass", True)
         card_layout = QtWidgets.QGridLayout(card)
         card_layout.setContentsMargins(16, 16, 16, 16)
         card_layout.setHorizontalSpacing(20)
@@ -71,6 +70,7 @@ class DashboardPage(QtWidgets.QWidget):
     def _live_panel(self) -> QtWidgets.QWidget:
         frame = QtWidgets.QFrame()
         frame.setObjectName("Card")
+        frame.setProperty("glass", True)
         layout = QtWidgets.QVBoxLayout(frame)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
@@ -87,6 +87,7 @@ class DashboardPage(QtWidgets.QWidget):
     def _metrics_panel(self) -> QtWidgets.QWidget:
         frame = QtWidgets.QFrame()
         frame.setObjectName("Card")
+        frame.setProperty("glass", True)
         layout = QtWidgets.QVBoxLayout(frame)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
@@ -108,6 +109,7 @@ class DashboardPage(QtWidgets.QWidget):
     def _quick_actions(self) -> QtWidgets.QWidget:
         card = QtWidgets.QFrame()
         card.setObjectName("Card")
+        card.setProperty("glass", True)
         layout = QtWidgets.QHBoxLayout(card)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
@@ -152,23 +154,21 @@ class DashboardPage(QtWidgets.QWidget):
 
     def set_demo(self, enabled: bool) -> None:
         self._demo_enabled = enabled
-        if enabled:
-            if not self._demo_timer.isActive():
-                self._demo_timer.start(80)
-            self.orientation.enable_demo(True)
-        else:
-            self._demo_timer.stop()
-            self.orientation.enable_demo(False)
+        self.orientation.enable_demo(enabled)
 
     # Demo ----------------------------------------------------------------
-    def _tick_demo(self) -> None:
-        if not self._demo_enabled:
+    def on_tick(self, phase: int) -> None:
+        """Общий демо-тик окна (~33 мс); страница обновляется на каждом втором и только на экране."""
+        if not self._demo_enabled or phase % 2 or not self.isVisible():
             return
+        self.emg_plot.tick_demo()
+        self.orientation.tick_demo()
         self._demo_phase += 0.12
-        muscle_value = 0.35 + 0.4 * max(0, random.random() - 0.4)
+        muscle_value = 0.35 + 0.4 * max(0, self._noise.random() - 0.4)
         self.muscle_bar.set_value(muscle_value)
-        self.fatigue.set_value(int((0.3 + 0.2 * random.random()) * 100))
-        if random.random() > 0.9:
-            gesture = random.choice(["MUSCLE_FLEX", "TILT_UP", "DOUBLE_FLEX"])
-            self.gesture_indicator.set_gesture(gesture, confidence=random.random())
-            self.emg_plot.append_point(0.95, event=gesture)
+        self.fatigue.set_value(int((0.3 + 0.2 * self._noise.random()) * 100))
+        if self._noise.random() > 0.9:
+            gesture = self._noise.choice(["MUSCLE_FLEX", "TILT_UP", "DOUBLE_FLEX"])
+            self.gesture_indicator.set_gesture(gesture, confidence=self._noise.random())
+            self.emg_plot.append_point_nodraw(0.95, event=gesture)
+        self.emg_plot.flush()
@@ -41,6 +41,7 @@ class GamesPage(QtWidgets.QWidget):
     def _game_card(self, title: str, desc: str, difficulty: str, best: str) -> QtWidgets.QWidget:
         card = QtWidgets.QFrame()
         card.setObjectName("Card")
+        card.setProperty("glass", True)
         vbox = QtWidgets.QVBoxLayout(card)
         vbox.setContentsMargins(12, 12, 12, 12)
         vbox.setSpacing(6)
@@ -45,6 +45,7 @@ class TrainingPage(QtWidgets.QWidget):
     def _exercise_card(self, title: str, desc: str, cta: str) -> QtWidgets.QWidget:
         card = QtWidgets.QFrame()
         card.setObjectName("Card")
+        card.setProperty("glass", True)
         vbox = QtWidgets.QVBoxLayout(card)
         vbox.setContentsMargins(12, 12, 12, 12)
         vbox.setSpacing(6)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import contextlib
 import threading
 import time
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import numpy as np
 
@@ -16,30 +16,62 @@ from callibri_control.core.sensor_manager import SensorManager
 from callibri_control.utils.config_manager import ConfigManager
 from callibri_control.detection.adaptive_thresholds import AdaptiveThresholds
 from callibri_control.detection.fatigue_monitor import FatigueMonitor
-from callibri_control.detection.gesture_detector import GestureDetector, DetectorConfig
+from callibri_control.detection.gesture_detector import GestureDetector, DetectorConfig, GestureEvent, Metrics
 from callibri_control.control.profiles import ProfileManager
-from callibri_control.control.keyboard_emulator import KeyboardEmulator
-from callibri_control.control.mouse_emulator import MouseEmulator
+from callibri_control.control.action_mapper import MacroAction
+from callibri_control.control.keyboard_emulator import KeyboardAction, KeyboardEmulator
+from callibri_control.control.mouse_emulator import MouseAction, MouseEmulator
+
+
+def _quantiles(arr: np.ndarray, qs: Tuple[float, ...]) -> List[float]:
+    """
+    Квантили уровней qs — доли в [0, 1] (0.2, а не 20 как у np.percentile).
+    Интерполяция линейная, как у np.percentile, но одним np.partition вместо сортировки.
+    """
+    last = arr.size - 1
+    pos = [q * last for q in qs]
+    kth = sorted({min(int(p) + d, last) for p in pos for d in (0, 1)})
+    part = np.partition(arr, kth)
+    out = []
+    for p in pos:
+        lo = int(p)
+        frac = p - lo
+        value = float(part[lo])
+        if frac:
+            value += frac * (float(part[lo + 1]) - value)
+        out.append(value)
+    return out
 
 
 class SensorBridge(QtCore.QObject):
+    POLL_MS = 50  # период опроса потока данных
+
     deviceInfo = QtCore.pyqtSignal(dict)
     statusText = QtCore.pyqtSignal(str, int)  # text, battery
     emgRms = QtCore.pyqtSignal(float)
     orientation = QtCore.pyqtSignal(float, float, float)
     accMagnitude = QtCore.pyqtSignal(float)
-    gestureDetected = QtCore.pyqtSignal(dict)
+    gestureDetected = QtCore.pyqtSignal(object)
     fatigueIndex = QtCore.pyqtSignal(float)
+    thresholdsChanged = QtCore.pyqtSignal(float, float)  # baseline, mvc
 
     def __init__(self, manager: Optional[SensorManager], cfg: Optional[ConfigManager] = None) -> None:
         super().__init__()
         self.manager = manager
         self.cfg = cfg
         self.stream: Optional[DataStream] = None
-        self._worker: Optional[threading.Thread] = None
+        self._thread: Optional[QtCore.QThread] = None
+        self._timer: Optional[QtCore.QTimer] = None
+        self._device = None
+        self._battery = 0
         self._stop = threading.Event()
         self.demo_mode = bool(cfg.config.get("general", {}).get("demo_mode", False) if cfg else False)
         self.thresholds = AdaptiveThresholds(mvc=0.2, baseline=0.0)
+        self._published_thresholds = (self.thresholds.baseline, self.thresholds.mvc)
+        # сглаженный baseline живёт отдельно: в thresholds попадает только заметный сдвиг,
+        # иначе кэш порогов AdaptiveThresholds сбрасывался бы на каждом опросе
+        self._baseline_ema = self.thresholds.baseline
+        self._reset_emitted()
         self.detector = GestureDetector(
             self.thresholds,
             fatigue=FatigueMonitor(fs=int((cfg.config.get("sensor", {}).get("emg_sampling_rate", 500)) if cfg else 500)),
@@ -55,11 +87,25 @@ class SensorBridge(QtCore.QObject):
 
     @QtCore.pyqtSlot()
     def start(self) -> None:
-        if self._worker and self._worker.is_alive():
+        if self._thread is not None and self._thread.isRunning():
             return
         self._stop.clear()
-        self._worker = threading.Thread(target=self._loop, daemon=True)
-        self._worker.start()
+        self._reset_emitted()
+        self._device = None
+        # Рабочий QThread со своим event loop: опрос по QTimer вместо while + time.sleep.
+        # Слоты подключены напрямую и выполняются в рабочем потоке, сигналы в UI уходят очередью.
+        thread = QtCore.QThread()
+        timer = QtCore.QTimer()
+        timer.setInterval(self.POLL_MS)
+        timer.moveToThread(thread)
+        thread.started.connect(self._on_thread_started, QtCore.Qt.ConnectionType.DirectConnection)
+        thread.finished.connect(self._on_thread_finished, QtCore.Qt.ConnectionType.DirectConnection)
+        # по завершении объекты удаляет Qt, а ссылки на них отпускаем в UI-потоке
+        thread.finished.connect(timer.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(lambda: self._forget_thread(thread))
+        self._thread, self._timer = thread, timer
+        thread.start()
 
     @QtCore.pyqtSlot()
     def stop(self) -> None:
@@ -69,38 +115,66 @@ class SensorBridge(QtCore.QObject):
                 self.stream.stop()
         with contextlib.suppress(Exception):
             self.manager.disconnect()
-        if self._worker and self._worker.is_alive():
-            self._worker.join(timeout=1.0)
+        if self._thread is not None and self._thread.isRunning():
+            # поиск/подключение не прерываются, но проверяют _stop между фазами и ограничены
+            # своими таймаутами — ждём до конца, чтобы поток не остался держать устройство
+            self._thread.quit()
+            self._thread.wait()
 
-    def _loop(self) -> None:
+    def _forget_thread(self, thread: QtCore.QThread) -> None:
+        if self._thread is thread:
+            self._thread = self._timer = None
+
+    def _on_thread_started(self) -> None:
         if self.demo_mode or self.manager is None:
-            self._loop_demo()
+            self._setup_demo()
+            poll = self._poll_demo
+        elif self._setup_device():
+            poll = self._poll_device
+        else:
+            self._thread.quit()
             return
+        self._timer.timeout.connect(poll, QtCore.Qt.ConnectionType.DirectConnection)
+        self._timer.start()
+
+    def _on_thread_finished(self) -> None:
+        self._timer.stop()
+        if self._device is not None:
+            with contextlib.suppress(Exception):
+                self.stream.stop()
+            with contextlib.suppress(Exception):
+                self.manager.disconnect()
 
-        self.statusText.emit("Поиск устройств...", 0)
-        devices = self.manager.scan_devices()
+    def _setup_device(self) -> bool:
+        """Поиск, подключение и калибровка; False — опрашивать нечего."""
+        self._emit_status("Поиск устройств...", 0)
+        devices = self.manager.scan_devices(first_match=True)
+        if self._stop.is_set():
+            return False
         if not devices:
-            if self.demo_mode:
-                self._loop_demo()
-                return
-            self.statusText.emit("Нет Callibri рядом", 0)
-            return
+            self._emit_status("Нет Callibri рядом", 0)
+            return False
         target = devices[0]["sensor_info"]
         if not self.manager.connect(target, wait=True, timeout=self.manager.scan_timeout + 5):
-            if self.demo_mode:
-                self._loop_demo()
-                return
-            self.statusText.emit("Не удалось подключиться", 0)
-            return
+            self._emit_status("Не удалось подключиться", 0)
+            return False
+        if self._stop.is_set():
+            # stop() мог отключить менеджер раньше, чем подключение завершилось
+            with contextlib.suppress(Exception):
+                self.manager.disconnect()
+            return False
         info = self.manager.get_device_info() or {}
-        battery = int(info.get("battery", 0) or 0) if str(info.get("battery", "")).isdigit() else 0
+        self._battery = int(info.get("battery", 0) or 0) if str(info.get("battery", "")).isdigit() else 0
         self.deviceInfo.emit(info)
-        self.statusText.emit("Активно", battery)
+        self._emit_status("Активно", self._battery)
 
         device = self.manager.get_device()
         if device is None:
-            self.statusText.emit("Ошибка устройства", battery)
-            return
+            self._emit_status("Ошибка устройства", self._battery)
+            return False
+        self._device = device  # дальше устройство отключит _on_thread_finished
+        if self._stop.is_set():
+            return False
 
         use_envelope = bool((self.cfg.config.get("sensor", {}) if self.cfg else {}).get("use_envelope", True))
         self.stream = DataStream(
@@ -113,100 +187,146 @@ class SensorBridge(QtCore.QObject):
         )
         self.stream.start()
         self._auto_calibrate()
+        self._baseline_ema = self.thresholds.baseline
+        return not self._stop.is_set()
+
+    def _poll_device(self) -> None:
+        metrics = self.stream.latest_stream_metrics()
+        rms = metrics.emg_rms
+        # динамическое адаптирование baseline/mvc для живых демонстраций без отдельной калибровки
+        ema = self._baseline_ema
+        if rms < ema * 1.2 + 0.01:
+            ema = self._baseline_ema = 0.98 * ema + 0.02 * rms
+            # тот же допуск 1% диапазона, что и в _publish_thresholds
+            if abs(ema - self.thresholds.baseline) > 0.01 * max(self.thresholds.mvc - ema, 1e-3):
+                self.thresholds.baseline = ema
+        if rms > self.thresholds.mvc * 0.9:
+            self.thresholds.update_calibration(mvc=max(rms, self.thresholds.mvc), baseline=self.thresholds.baseline)
+        self._publish_thresholds()
 
+        self.emgRms.emit(rms)
+        self.orientation.emit(metrics.pitch, metrics.roll, metrics.yaw)
+        self._emit_acc(metrics.acc_magnitude)
+
+        events = self.detector.process_metrics(metrics)
+        fatigue_state = self.detector.fatigue_state()
+        if fatigue_state:
+            self._emit_fatigue(float(fatigue_state.index))
+        for ev in events:
+            self.gestureDetected.emit(ev)
+            self._execute_action(ev)
+
+        # обновляем батарею из устройства, если доступно
         try:
-            while not self._stop.is_set():
-                metrics = self.stream.latest_metrics()
-                rms = float(metrics.get("emg_rms", 0.0) or 0.0)
-                # динамическое адаптирование baseline/mvc для живых демонстраций без отдельной калибровки
-                if rms < self.thresholds.baseline * 1.2 + 0.01:
-                    self.thresholds.baseline = 0.98 * self.thresholds.baseline + 0.02 * rms
-                if rms > self.thresholds.mvc * 0.9:
-                    self.thresholds.update_calibration(mvc=max(rms, self.thresholds.mvc), baseline=self.thresholds.baseline)
-
-                self.emgRms.emit(rms)
-                self.orientation.emit(
-                    float(metrics.get("pitch", 0.0) or 0.0),
-                    float(metrics.get("roll", 0.0) or 0.0),
-                    float(metrics.get("yaw", 0.0) or 0.0),
-                )
-                self.accMagnitude.emit(float(metrics.get("acc_magnitude", 0.0) or 0.0))
-
-                events = self.detector.process_metrics(metrics)
-                fatigue_state = self.detector.fatigue_state()
-                if fatigue_state:
-                    self.fatigueIndex.emit(float(fatigue_state.index))
-                for ev in events:
-                    self.gestureDetected.emit(ev)
-                    self._execute_action(ev)
-
-                # обновляем батарею из устройства, если доступно
-                try:
-                    batt_val = getattr(device, "batt_power", None)
-                    if batt_val is not None:
-                        battery = int(batt_val)
-                except Exception:
-                    pass
-                self.statusText.emit("Активно", battery)
-                time.sleep(0.05)
-        finally:
-            with contextlib.suppress(Exception):
-                self.stream.stop()
-            with contextlib.suppress(Exception):
-                self.manager.disconnect()
+            batt_val = getattr(self._device, "batt_power", None)
+            if batt_val is not None:
+                self._battery = int(batt_val)
+        except Exception:
+            pass
+        self._emit_status("Активно", self._battery)
 
-    def _loop_demo(self) -> None:
+    def _setup_demo(self) -> None:
         """Симуляция потока без датчика для демонстраций/тестов."""
-        self.statusText.emit("Демо режим", 0)
+        self._emit_status("Демо режим", 0)
         # Настройка порогов под синтетический сигнал
         self.thresholds.update_calibration(mvc=0.6, baseline=0.08)
-        t = 0.0
-        while not self._stop.is_set():
-            # EMG: базовый шум + импульсы
-            rms = 0.08 + 0.05 * np.sin(t) + np.random.uniform(0, 0.05)
-            if np.random.rand() > 0.96:
-                rms += 0.35  # всплеск как FLEX
-
-            pitch = 15 * np.sin(t / 1.5)
-            roll = 18 * np.sin(t / 1.1 + 1.3)
-            acc_mag = 1.0 + abs(np.sin(t)) * 0.6
-            metrics = {
-                "emg_rms": rms,
-                "pitch": pitch,
-                "roll": roll,
-                "acc_magnitude": acc_mag,
-            }
-            self.emgRms.emit(rms)
-            self.orientation.emit(pitch, roll, 0.0)
-            self.accMagnitude.emit(acc_mag)
-
-            events = self.detector.process_metrics(metrics)
-            fatigue_state = self.detector.fatigue_state()
-            if fatigue_state:
-                self.fatigueIndex.emit(float(fatigue_state.index))
-            for ev in events:
-                self.gestureDetected.emit(ev)
-                self._execute_action(ev)
-
-            self.statusText.emit("Демо режим", 100)
-            t += 0.08
-            time.sleep(0.05)
+        self._publish_thresholds(force=True)
+        # Волны на 60 с синтетического времени считаем одним векторным проходом,
+        # опрос только читает значения по индексу
+        tt = np.arange(0.0, 60.0, 0.08)
+        self._demo_base = 0.08 + 0.05 * np.sin(tt)
+        self._demo_pitch = (15 * np.sin(tt / 1.5)).tolist()
+        self._demo_roll = (18 * np.sin(tt / 1.1 + 1.3)).tolist()
+        self._demo_acc = (1.0 + np.abs(np.sin(tt)) * 0.6).tolist()
+        self._demo_rms: List[float] = []
+        self._demo_rng = np.random.default_rng()
+        self._demo_idx = 0
+
+    def _poll_demo(self) -> None:
+        n = len(self._demo_pitch)
+        i = self._demo_idx % n
+        if i == 0:
+            # шум и всплески (как FLEX) на следующий проход по таблице
+            rng = self._demo_rng
+            self._demo_rms = (self._demo_base + rng.uniform(0, 0.05, n) + np.where(rng.random(n) > 0.96, 0.35, 0.0)).tolist()
+        self._demo_idx += 1
+
+        rms = self._demo_rms[i]
+        pitch = self._demo_pitch[i]
+        roll = self._demo_roll[i]
+        acc_mag = self._demo_acc[i]
+        metrics = Metrics(rms, pitch, roll, acc_mag)
+        self.emgRms.emit(rms)
+        self.orientation.emit(pitch, roll, 0.0)
+        self._emit_acc(acc_mag)
+
+        events = self.detector.process_metrics(metrics)
+        fatigue_state = self.detector.fatigue_state()
+        if fatigue_state:
+            self._emit_fatigue(float(fatigue_state.index))
+        for ev in events:
+            self.gestureDetected.emit(ev)
+            self._execute_action(ev)
+
+        self._emit_status("Демо режим", 100)
+
     def _auto_calibrate(self) -> None:
         """Мини-калибровка: берём окно RMS, вычисляем baseline/peak и обновляем пороги."""
         if not self.stream:
             return
-        rms_samples: List[float] = []
+        # окно 1.5 с по 50 мс: буфер с запасом, заполняем по индексу
+        rms_samples = np.empty(32, dtype=np.float64)
+        count = 0
         t_end = time.time() + 1.5
-        while time.time() < t_end and not self._stop.is_set():
-            metrics = self.stream.latest_metrics()
-            rms_samples.append(float(metrics.get("emg_rms", 0.0) or 0.0))
+        while time.time() < t_end and count < rms_samples.size and not self._stop.is_set():
+            rms_samples[count] = self.stream.latest_stream_metrics().emg_rms
+            count += 1
             time.sleep(0.05)
-        if not rms_samples:
+        if not count:
             return
-        baseline = float(np.percentile(rms_samples, 20))
-        mvc = float(np.percentile(rms_samples, 95))
+        baseline, mvc = _quantiles(rms_samples[:count], (0.20, 0.95))
         mvc = max(mvc, baseline + 0.05)
         self.thresholds.update_calibration(mvc=mvc, baseline=baseline)
+        self._publish_thresholds(force=True)
+
+    def _publish_thresholds(self, force: bool = False) -> None:
+        """Сообщает UI baseline/mvc; мелкий дрейф адаптивного baseline (<1% диапазона) не шлём."""
+        baseline, mvc = self.thresholds.baseline, self.thresholds.mvc
+        last_baseline, last_mvc = self._published_thresholds
+        if not force and abs(baseline - last_baseline) + abs(mvc - last_mvc) <= 0.01 * max(mvc - baseline, 1e-3):
+            return
+        self._published_thresholds = (baseline, mvc)
+        self.thresholdsChanged.emit(baseline, mvc)
+
+    # Повторяющиеся сигналы шлём только при изменении: каждый emit из потока — событие в очереди UI.
+    # Статус всё равно повторяем раз в секунду, чтобы UI не залипал на старом значении.
+    # Ориентацию шлём на каждом опросе: по ней с частотой опроса идёт график наклона,
+    # мёртвая зона для 3D-виджета — в MainWindow.
+    def _reset_emitted(self) -> None:
+        self._last_status: Tuple[Optional[str], int] = (None, -1)
+        self._last_status_ts = 0.0
+        self._last_acc: Optional[float] = None
+        self._last_fatigue: Optional[float] = None
+
+    def _emit_status(self, text: str, battery: int) -> None:
+        now = time.monotonic()
+        if (text, battery) == self._last_status and now - self._last_status_ts < 1.0:
+            return
+        self._last_status = (text, battery)
+        self._last_status_ts = now
+        self.statusText.emit(text, battery)
+
+    def _emit_acc(self, acc_mag: float) -> None:
+        if self._last_acc is not None and abs(acc_mag - self._last_acc) <= 0.01:
+            return
+        self._last_acc = acc_mag
+        self.accMagnitude.emit(acc_mag)
+
+    def _emit_fatigue(self, index: float) -> None:
+        if index == self._last_fatigue:
+            return
+        self._last_fatigue = index
+        self.fatigueIndex.emit(index)
 
     def set_control_profile(self, name: str) -> None:
         try:
@@ -214,22 +334,22 @@ class SensorBridge(QtCore.QObject):
         except Exception:
             self.profile_mgr.set_active("DEFAULT")
 
-    def _execute_action(self, event: dict) -> None:
-        action = self.profile_mgr.get_action(event.get("type", ""))
-        if not action:
+    def _execute_action(self, event: GestureEvent) -> None:
+        action = self.profile_mgr.get_action(event.type)
+        if action is None:
             return
         try:
-            if action.get("type") == "keyboard":
-                self.kb.execute(self.profile_mgr.mapper.to_keyboard_action(action))  # type: ignore[arg-type]
-            elif action.get("type") == "mouse":
-                self.mouse.execute(self.profile_mgr.mapper.to_mouse_action(action))  # type: ignore[arg-type]
-            elif action.get("type") == "macro":
-                for step in action.get("steps", []):
-                    if step.get("type") == "keyboard":
-                        self.kb.execute(self.profile_mgr.mapper.to_keyboard_action(step))  # type: ignore[arg-type]
-                    elif step.get("type") == "mouse":
-                        self.mouse.execute(self.profile_mgr.mapper.to_mouse_action(step))  # type: ignore[arg-type]
-                    time.sleep(step.get("delay", 0) / 1000 if isinstance(step, dict) else 0)
+            if isinstance(action, KeyboardAction):
+                self.kb.execute(action)
+            elif isinstance(action, MouseAction):
+                self.mouse.execute(action)
+            elif isinstance(action, MacroAction):
+                for step, delay in action.steps:
+                    if isinstance(step, KeyboardAction):
+                        self.kb.execute(step)
+                    elif isinstance(step, MouseAction):
+                        self.mouse.execute(step)
+                    time.sleep(delay)
         except Exception:
             # не рушим поток стриминга из-за экшена
             pass
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Optional, Tuple
 
 from PyQt6 import QtCore, QtGui, QtWidgets
@@ -10,14 +11,42 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 class MuscleBar(QtWidgets.QWidget):
     """Горизонтальный бар: зелёный → жёлтый → красный, с отметками порогов."""
 
-    def __init__(self, parent: Optional[QtWidgets.QWidget] = None, thresholds: Optional[Tuple[float, float]] = None) -> None:
+    def __init__(
+        self,
+        parent: Optional[QtWidgets.QWidget] = None,
+        thresholds: Optional[Tuple[float, float]] = None,
+        max_redraw_rate: float = 30.0,
+    ) -> None:
         super().__init__(parent)
         self.setMinimumHeight(36)
         self._value = 0.0
         self.thresholds = thresholds or (0.4, 0.7)  # mid / high как доля MVC
+        # значение обновляется на каждом кадре данных, перерисовываем не чаще max_redraw_rate
+        self._min_redraw_s = 0.0
+        self._last_redraw = 0.0
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._redraw)
+        self.set_max_redraw_rate(max_redraw_rate)
+
+    def set_max_redraw_rate(self, hz: float) -> None:
+        """Не чаще hz перерисовок в секунду; 0 — без ограничения."""
+        self._min_redraw_s = 1.0 / hz if hz > 0 else 0.0
 
     def set_value(self, value: float) -> None:
-        self._value = max(0.0, min(1.0, value))
+        value = max(0.0, min(1.0, value))
+        if value == self._value or self._redraw_timer.isActive():
+            self._value = value
+            return
+        self._value = value
+        wait = self._last_redraw + self._min_redraw_s - time.monotonic()
+        if wait > 0:
+            self._redraw_timer.start(int(wait * 1000) + 1)
+        else:
+            self._redraw()
+
+    def _redraw(self) -> None:
+        self._last_redraw = time.monotonic()
         self.update()
 
     def set_thresholds(self, mid: float, high: float) -> None:
@@ -18,11 +18,7 @@ class OrientationVisualizer(QtWidgets.QWidget):
         self.pitch = 0.0
         self.roll = 0.0
         self.yaw = 0.0
-        self._demo_mode = demo_mode
-        self._demo_timer = QtCore.QTimer(self)
-        self._demo_timer.timeout.connect(self._tick_demo)
-        if demo_mode:
-            self.enable_demo(True)
+        self._demo_mode = demo_mode  # демо-анимацию тикает владелец (tick_demo), своего таймера нет
 
     def set_orientation(self, pitch: float, roll: float, yaw: float = 0.0) -> None:
         self.pitch = pitch
@@ -32,11 +28,6 @@ class OrientationVisualizer(QtWidgets.QWidget):
 
     def enable_demo(self, enabled: bool) -> None:
         self._demo_mode = enabled
-        if enabled:
-            if not self._demo_timer.isActive():
-                self._demo_timer.start(60)
-        else:
-            self._demo_timer.stop()
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
         painter = QtGui.QPainter(self)
@@ -87,7 +78,9 @@ class OrientationVisualizer(QtWidgets.QWidget):
         )
         painter.end()
 
-    def _tick_demo(self) -> None:
+    def tick_demo(self) -> None:
+        if not self._demo_mode:
+            return
         self.pitch = 10 * math.sin(QtCore.QTime.currentTime().msec() / 180.0)
         self.roll = 15 * math.cos(QtCore.QTime.currentTime().msec() / 160.0)
         self.yaw = (self.yaw + random.uniform(-2, 2)) % 360
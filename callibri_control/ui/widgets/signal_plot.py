@@ -4,48 +4,112 @@ from __future__ import annotations
 
 import math
 import random
+import time
 from collections import deque
+from functools import lru_cache
 from typing import Iterable, Optional, Tuple
 
+import numpy as np
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
 class SignalPlot(QtWidgets.QWidget):
     """Лёгкий виджет графика с авто-масштабом и опциональной демо-анимацией."""
 
+    # Сглаживание толстой линии — самая дорогая часть растеризации в CPU-рендере
+    antialias = False
+
     def __init__(
         self,
         parent: Optional[QtWidgets.QWidget] = None,
         max_points: int = 300,
         demo_mode: bool = False,
         thresholds: Optional[Tuple[float, float, float]] = None,
+        max_redraw_rate: float = 30.0,
     ) -> None:
         super().__init__(parent)
         self.setMinimumHeight(160)
-        self.values: deque[float] = deque(maxlen=max_points)
+        # кольцевой буфер точек: запись без аллокаций, отрисовка считает координаты векторно
+        self.max_points = max_points
+        self._buf = np.zeros(max(max_points, 1), dtype=np.float64)
+        self._total = 0  # всего принятых точек; позиция записи = _total % max_points
+        self._dirty = False
+        self._background: Optional[QtGui.QPixmap] = None
         self.thresholds = thresholds
-        self.events: deque[Tuple[int, str]] = deque(maxlen=20)
+        self.events: deque[Tuple[int, str]] = deque(maxlen=20)  # (абсолютный номер точки, подпись)
         self._demo_mode = demo_mode
         self._demo_phase = 0.0
+        # ограничение частоты перерисовки: данные могут приходить чаще, чем имеет смысл рисовать
+        self._min_redraw_s = 0.0
+        self._last_redraw = 0.0
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._redraw)
+        self.set_max_redraw_rate(max_redraw_rate)
 
-        if demo_mode:
-            self._demo_timer = QtCore.QTimer(self)
-            self._demo_timer.timeout.connect(self._add_demo_point)
-            self._demo_timer.start(50)
 
     # Public API ----------------------------------------------------------
+    def set_max_redraw_rate(self, hz: float) -> None:
+        """Не чаще hz перерисовок в секунду; 0 — без ограничения."""
+        self._min_redraw_s = 1.0 / hz if hz > 0 else 0.0
+
     def set_thresholds(self, low: float, mid: float, high: float) -> None:
         self.thresholds = (low, mid, high)
         self.update()
 
+    @property
+    def values(self) -> np.ndarray:
+        """Текущие точки по порядку (копия)."""
+        n = self._buf.shape[0]
+        if self._total <= n:
+            return self._buf[: self._total].copy()
+        head = self._total % n
+        return np.concatenate((self._buf[head:], self._buf[:head]))
+
     def append_point(self, value: float, event: Optional[str] = None) -> None:
-        self.values.append(value)
+        self.append_point_nodraw(value, event)
+        self.flush()
+
+    def append_point_nodraw(self, value: float, event: Optional[str] = None) -> None:
+        """Кладёт точку в буфер без перерисовки; отрисует ближайший flush()."""
+        self._buf[self._total % self._buf.shape[0]] = value
         if event:
-            self.events.append((len(self.values) - 1, event))
-        self.update()
+            self.events.append((self._total, event))
+        self._total += 1
+        self._dirty = True
 
     def extend(self, values: Iterable[float]) -> None:
-        self.values.extend(values)
+        chunk = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=np.float64).ravel()
+        n = self._buf.shape[0]
+        if chunk.shape[0] > n:
+            self._total += chunk.shape[0] - n
+            chunk = chunk[-n:]
+        if chunk.shape[0]:
+            idx = (self._total + np.arange(chunk.shape[0])) % n
+            self._buf[idx] = chunk
+            self._total += chunk.shape[0]
+            self._dirty = True
+        self.flush()
+
+    def clear(self) -> None:
+        self._total = 0
+        self.events.clear()
+        self._dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        """Одна перерисовка за все точки, добавленные с прошлого flush()."""
+        if not self._dirty or self._redraw_timer.isActive():
+            return
+        wait = self._last_redraw + self._min_redraw_s - time.monotonic()
+        if wait > 0:
+            self._redraw_timer.start(int(wait * 1000) + 1)
+        else:
+            self._redraw()
+
+    def _redraw(self) -> None:
+        self._dirty = False
+        self._last_redraw = time.monotonic()
         self.update()
 
     # Painting ------------------------------------------------------------
@@ -53,24 +117,23 @@ class SignalPlot(QtWidgets.QWidget):
         painter = QtGui.QPainter(self)
         if not painter.isActive():
             return
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, self.antialias)
 
         rect = self.rect().adjusted(10, 10, -10, -10)
-        painter.fillRect(self.rect(), QtGui.QColor("#0b1224"))
-
-        # Grid
-        painter.setPen(QtGui.QPen(QtGui.QColor("#1f2937"), 1))
-        for x in range(0, rect.width(), max(1, rect.width() // 8)):
-            painter.drawLine(rect.left() + x, rect.top(), rect.left() + x, rect.bottom())
-        for y in range(0, rect.height(), max(1, rect.height() // 4)):
-            painter.drawLine(rect.left(), rect.top() + y, rect.right(), rect.top() + y)
-
-        if not self.values:
+        # фон с сеткой не зависит от данных: рисуем его один раз на размер и дальше только копируем
+        # при переносе окна на экран с другим масштабом пиксмап надо перерисовать
+        if self._background is None or self._background.devicePixelRatio() != self.devicePixelRatioF():
+            self._background = self._render_background(rect)
+        painter.drawPixmap(0, 0, self._background)
+
+        values = self.values
+        count = values.shape[0]
+        if not count:
             painter.end()
             return
 
-        v_min = min(self.values)
-        v_max = max(self.values)
+        v_min = float(values.min())
+        v_max = float(values.max())
         span = max(v_max - v_min, 1e-6)
 
         # thresholds
@@ -81,30 +144,94 @@ class SignalPlot(QtWidgets.QWidget):
                 painter.setPen(QtGui.QPen(QtGui.QColor(color), 1, QtCore.Qt.PenStyle.DashLine))
                 painter.drawLine(rect.left(), int(y), rect.right(), int(y))
 
-        path = QtGui.QPainterPath()
-        step_x = rect.width() / max(len(self.values) - 1, 1)
-        for idx, val in enumerate(self.values):
-            x = rect.left() + idx * step_x
-            y = rect.bottom() - (val - v_min) / span * rect.height()
-            if idx == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
+        # координаты всех точек пишем прямо в память QPolygonF (пары double x, y),
+        # если раскладка это позволяет; иначе считаем в numpy и собираем QPointF
+        step_x = rect.width() / max(count - 1, 1)
+        curve = _peak_downsample(values, rect.width())
+        n = curve.shape[0]
+        if _polygon_buffer_ok():
+            poly = QtGui.QPolygonF()
+            poly.resize(n)
+            ptr = poly.data()
+            ptr.setsize(n * 16)
+            xy = np.frombuffer(ptr, dtype=np.float64).reshape(n, 2)
+        else:
+            poly = None
+            xy = np.empty((n, 2), dtype=np.float64)
+        np.multiply(np.arange(n), rect.width() / max(n - 1, 1), out=xy[:, 0])
+        xy[:, 0] += rect.left()
+        np.subtract(curve, v_min, out=xy[:, 1])
+        xy[:, 1] *= -rect.height() / span
+        xy[:, 1] += rect.bottom()
+        if poly is None:
+            poly = QtGui.QPolygonF([QtCore.QPointF(x, y) for x, y in xy.tolist()])
         painter.setPen(QtGui.QPen(QtGui.QColor("#60a5fa"), 2))
-        painter.drawPath(path)
+        painter.drawPolyline(poly)
 
-        # Events markers
+        # Events markers: номер точки абсолютный, поэтому маркер уезжает вместе с графиком
         painter.setPen(QtGui.QPen(QtGui.QColor("#a855f7"), 1.5))
-        for idx, name in self.events:
-            x = rect.left() + idx * step_x
-            painter.drawLine(x, rect.top(), x, rect.bottom())
+        first = self._total - count
+        for abs_idx, name in self.events:
+            if abs_idx < first:
+                continue
+            x = rect.left() + (abs_idx - first) * step_x
+            painter.drawLine(QtCore.QLineF(x, rect.top(), x, rect.bottom()))
             painter.drawText(int(x) + 4, rect.top() + 16, name)
 
         painter.end()
 
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # noqa: N802
+        self._background = None
+        super().resizeEvent(event)
+
+    def _render_background(self, rect: QtCore.QRect) -> QtGui.QPixmap:
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(QtCore.QSize(round(self.width() * ratio), round(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtGui.QColor("#0b1224"))
+        painter = QtGui.QPainter(pixmap)
+        # Grid
+        painter.setPen(QtGui.QPen(QtGui.QColor("#1f2937"), 1))
+        for x in range(0, rect.width(), max(1, rect.width() // 8)):
+            painter.drawLine(rect.left() + x, rect.top(), rect.left() + x, rect.bottom())
+        for y in range(0, rect.height(), max(1, rect.height() // 4)):
+            painter.drawLine(rect.left(), rect.top() + y, rect.right(), rect.top() + y)
+        painter.end()
+        return pixmap
+
     # Demo ----------------------------------------------------------------
-    def _add_demo_point(self) -> None:
-        # Пульс + шум для живости
+    def tick_demo(self) -> None:
+        """Демо-точка (пульс + шум) без перерисовки; тикает владелец из общего таймера, рисует flush()."""
+        if not self._demo_mode:
+            return
         self._demo_phase += 0.15
         value = 0.4 + 0.25 * (1 + math.cos(self._demo_phase)) + random.uniform(-0.05, 0.05)
-        self.append_point(value)
+        self.append_point_nodraw(value)
+
+
+@lru_cache(maxsize=1)
+def _polygon_buffer_ok() -> bool:
+    """
+    Проверяет один раз, что память QPolygonF — записываемый непрерывный массив пар double.
+    PyQt6 этого не обещает (зависит от qreal и сборки sip), поэтому при несовпадении рисуем через QPointF.
+    """
+    poly = QtGui.QPolygonF([QtCore.QPointF(1.0, 2.0), QtCore.QPointF(3.0, 4.0)])
+    try:
+        ptr = poly.data()
+        ptr.setsize(4 * 8)
+        arr = np.frombuffer(ptr, dtype=np.float64)
+    except (TypeError, ValueError, BufferError):
+        return False
+    return bool(arr.flags.writeable) and arr.tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def _peak_downsample(values: np.ndarray, width: int) -> np.ndarray:
+    """Если точек больше, чем по две на пиксель, оставляет min/max каждого столбца."""
+    count = values.shape[0]
+    if width <= 0 or count <= 2 * width:
+        return values
+    edges = np.linspace(0, count, width + 1).astype(np.intp)[:-1]
+    out = np.empty(2 * width, dtype=np.float64)
+    out[0::2] = np.minimum.reduceat(values, edges)
+    out[1::2] = np.maximum.reduceat(values, edges)
+    return out
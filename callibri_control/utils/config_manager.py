@@ -25,6 +25,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     },
     "ui": {
         "theme": "dark",
+        "tts": {"enabled": True},
     },
     "recognition": {
         "sensitivity_profile": "NORMAL",
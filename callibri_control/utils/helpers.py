@@ -1,5 +1,40 @@
 """Helper utilities placeholder."""
 
+from typing import Optional, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
 
 def clamp(value, min_value, max_value):
     return max(min_value, min(value, max_value))
+
+
+class NoiseBuffer:
+    """Заранее сгенерированные случайные числа для демо-таймеров.
+
+    Один векторный вызов генератора на size значений вместо random.* на каждом тике;
+    буфер перегенерируется, когда значения заканчиваются.
+    """
+
+    def __init__(self, size: int = 4096, seed: Optional[int] = None) -> None:
+        self._rng = np.random.default_rng(seed)
+        self._size = size
+        self._values = self._rng.random(size).tolist()
+        self._idx = 0
+
+    def random(self) -> float:
+        """Следующее число из [0, 1)."""
+        if self._idx >= self._size:
+            self._values = self._rng.random(self._size).tolist()
+            self._idx = 0
+        value = self._values[self._idx]
+        self._idx += 1
+        return value
+
+    def uniform(self, low: float, high: float) -> float:
+        return low + (high - low) * self.random()
+
+    def choice(self, options: Sequence[T]) -> T:
+        return options[int(self.random() * len(options))]
@@ -256,7 +256,7 @@ class WebDataPump:
     def _connect(self) -> Optional[Dict[str, str]]:
         if self.manager is None:
             return None
-        devices = self.manager.scan_devices()
+        devices = self.manager.scan_devices(target_address=self.address, first_match=not self.address)
         if not devices:
             LOGGER.warning("Callibri не найдены поблизости.")
             return None
@@ -300,7 +300,7 @@ class WebDataPump:
         fatigue_idx = float(fatigue_state.index) if fatigue_state else 0.0
         gesture_payload = None
         if events:
-            gesture_payload = dict(events[-1])
+            gesture_payload = events[-1]._asdict()
             threshold = self.thresholds.thresholds_for_profile(self.detector.config.profile).on
             g_val = abs(float(gesture_payload.get("value", 0.0)))
             gesture_payload["confidence"] = max(0.05, min(g_val / max(threshold, 1e-3), 2.0))
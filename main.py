@@ -7,12 +7,12 @@ import os
 from typing import Optional
 
 from callibri_control.core.calibration import Calibration
-from callibri_control.core.data_stream import DataStream
+from callibri_control.core.data_stream import DataStream, acc_to_pitch_roll_deg
 from callibri_control.core.sensor_manager import SensorManager
 from callibri_control.utils.config_manager import ConfigManager
 from callibri_control.detection.adaptive_thresholds import AdaptiveThresholds
 from callibri_control.detection.fatigue_monitor import FatigueMonitor
-from callibri_control.detection.gesture_detector import GestureDetector, DetectorConfig
+from callibri_control.detection.gesture_detector import GestureDetector, DetectorConfig, GestureEvent, Metrics
 
 
 def configure_logging(level: str) -> None:
@@ -77,7 +77,7 @@ def run_scan(manager: SensorManager) -> int:
 
 
 def run_connect(manager: SensorManager, address: Optional[str]) -> int:
-    devices = manager.scan_devices()
+    devices = manager.scan_devices(target_address=address, first_match=not address)
     if not devices:
         print("Callibri devices not found.")
         return 1
@@ -129,7 +129,7 @@ def run_stream(manager: SensorManager, address: Optional[str], use_envelope: boo
     # Повторяем скан до 3 раз, если устройство не сразу видимо
     devices = []
     for _ in range(3):
-        devices = manager.scan_devices()
+        devices = manager.scan_devices(target_address=address, first_match=not address)
         if devices:
             break
         time.sleep(1.0)
@@ -231,7 +231,7 @@ def run_stream(manager: SensorManager, address: Optional[str], use_envelope: boo
 
 
 def run_calibrate(manager: SensorManager, address: Optional[str], use_envelope: bool, enable_orientation: bool) -> int:
-    devices = manager.scan_devices()
+    devices = manager.scan_devices(target_address=address, first_match=not address)
     if not devices:
         print("Callibri devices not found.")
         return 1
@@ -295,7 +295,7 @@ def run_detect(
     from neurosdk.cmn_types import SensorFamily, SensorCommand
     from neurosdk.scanner import Scanner
 
-    devices = manager.scan_devices()
+    devices = manager.scan_devices(target_address=address, first_match=not address)
     if not devices:
         print("Callibri devices not found.")
         return 1
@@ -373,8 +373,7 @@ def run_detect(
             pkt = packets[-1]
             ax, ay, az = pkt.Accelerometer.X, pkt.Accelerometer.Y, pkt.Accelerometer.Z
             acc_mag = math.sqrt(ax * ax + ay * ay + az * az)
-            pitch = math.degrees(math.atan2(ax, math.sqrt(ay * ay + az * az)))
-            roll = math.degrees(math.atan2(ay, az))
+            pitch, roll = acc_to_pitch_roll_deg(ax, ay, az)
             mems_state["pitch"] = pitch
             mems_state["roll"] = roll
             mems_state["acc_mag"] = acc_mag
@@ -456,13 +455,13 @@ def run_detect(
             rms, rms_raw, rms_centered, p2p, vmin, vmax = compute_metrics()
             rms_det = max(0.0, rms * gain)
             th = thresholds.thresholds_for_profile(profile.upper())
-            metrics = {
-                "emg_rms": rms_det,
-                "pitch": mems_state["pitch"],
-                "roll": mems_state["roll"],
-                "yaw": mems_state.get("yaw", 0.0),
-                "acc_magnitude": mems_state["acc_mag"],
-            }
+            metrics = Metrics(
+                emg_rms=rms_det,
+                pitch=mems_state["pitch"],
+                roll=mems_state["roll"],
+                acc_magnitude=mems_state["acc_mag"],
+                yaw=mems_state.get("yaw", 0.0),
+            )
             events = detector.process_metrics(metrics)
             # Дополнительные уровни силы: слабое / среднее / сильное
             span = max(mvc_g - baseline_g, 1e-6)
@@ -474,14 +473,14 @@ def run_detect(
             elif rms_det >= mid:
                 level = "MED"
             if level != last_level and level != "LOW":
-                events.append({"type": f"MUSCLE_{level}", "value": rms_det, "timestamp": time.time(), "duration_ms": 0})
+                events.append(GestureEvent(f"MUSCLE_{level}", rms_det, 0, time.time()))
             last_level = level
 
             if events:
                 for ev in events:
                     print(
-                        f"{ev['type']:<15} val={ev['value']:.3f} "
-                        f"dur={ev.get('duration_ms', 0)}ms t={ev['timestamp']:.3f}"
+                        f"{ev.type:<15} val={ev.value:.3f} "
+                        f"dur={ev.duration_ms}ms t={ev.timestamp:.3f}"
                     )
             indicator = ">" if rms_det >= th.on else " "
             if rms_det >= high:
@@ -531,7 +530,7 @@ def run_diag_emg(
     from neurosdk.scanner import Scanner
 
     scanner = Scanner([SensorFamily.LECallibri, SensorFamily.LEKolibri])
-    devices = manager.scan_devices()
+    devices = manager.scan_devices(target_address=address, first_match=not address)
     if not devices:
         print("Callibri devices not found.")
         return 1
@@ -639,7 +638,8 @@ def run_control(
 ) -> int:
     # Lazy imports to avoid requiring pynput when не используем управление
     from callibri_control.control.profiles import ProfileManager
-    from callibri_control.control.keyboard_emulator import KeyboardEmulator
+    from callibri_control.control.action_mapper import MacroAction, intern_gesture
+    from callibri_control.control.keyboard_emulator import KeyboardAction, KeyboardEmulator
     from callibri_control.control.mouse_emulator import MouseEmulator, MouseAction
     from callibri_control.core.data_stream import quaternion_to_euler_deg
 
@@ -657,7 +657,7 @@ def run_control(
     from neurosdk.cmn_types import SensorFamily, SensorCommand
     from neurosdk.scanner import Scanner
 
-    devices = manager.scan_devices()
+    devices = manager.scan_devices(target_address=address, first_match=not address)
     if not devices:
         print("Callibri devices not found.")
         return 1
@@ -736,8 +736,7 @@ def run_control(
             pkt = packets[-1]
             ax, ay, az = pkt.Accelerometer.X, pkt.Accelerometer.Y, pkt.Accelerometer.Z
             acc_mag = math.sqrt(ax * ax + ay * ay + az * az)
-            pitch = math.degrees(math.atan2(ax, math.sqrt(ay * ay + az * az)))
-            roll = math.degrees(math.atan2(ay, az))
+            pitch, roll = acc_to_pitch_roll_deg(ax, ay, az)
             mems_state["pitch"] = pitch
             mems_state["roll"] = roll
             mems_state["acc_mag"] = acc_mag
@@ -897,12 +896,12 @@ def run_control(
             rms, rms_raw, rms_centered, p2p, vmin, vmax = compute_metrics()
             rms_det = rms * gain
             th = thresholds.thresholds_for_profile(profile.upper())
-            metrics = {
-                "emg_rms": rms_det,
-                "pitch": mems_state["pitch"],
-                "roll": mems_state["roll"],
-                "acc_magnitude": mems_state["acc_mag"],
-            }
+            metrics = Metrics(
+                emg_rms=rms_det,
+                pitch=mems_state["pitch"],
+                roll=mems_state["roll"],
+                acc_magnitude=mems_state["acc_mag"],
+            )
             span = max(mvc_g - baseline_g, 1e-6)
             mid = baseline_g + span * mid_ratio
             high = baseline_g + span * high_ratio
@@ -912,7 +911,7 @@ def run_control(
             elif rms_det >= mid:
                 level = "MED"
             if level != last_level and level != "LOW":
-                events_level = [{"type": f"MUSCLE_{level}", "value": rms_det, "timestamp": time.time(), "duration_ms": 0}]
+                events_level = [GestureEvent(intern_gesture(f"MUSCLE_{level}"), rms_det, 0, time.time())]
             else:
                 events_level = []
             last_level = level
@@ -922,21 +921,21 @@ def run_control(
 
             events = detector.process_metrics(metrics) + events_level
             for ev in events:
-                action = profiles.get_action(ev["type"])
-                if not action:
+                action = profiles.get_action(ev.type)
+                if action is None:
                     continue
-                if action.get("type") == "macro":
-                    for step in action.get("steps", []):
-                        if step.get("type") == "keyboard":
-                            kb.execute(profiles.mapper.to_keyboard_action(step))  # type: ignore[arg-type]
-                        elif step.get("type") == "mouse":
-                            mouse.execute(profiles.mapper.to_mouse_action(step))  # type: ignore[arg-type]
-                        time.sleep(step.get("delay", 0) / 1000 if isinstance(step, dict) else 0)
-                elif action.get("type") == "keyboard":
-                    kb.execute(profiles.mapper.to_keyboard_action(action))  # type: ignore[arg-type]
-                elif action.get("type") == "mouse":
-                    mouse.execute(profiles.mapper.to_mouse_action(action))  # type: ignore[arg-type]
-                print(f"{ev['type']} -> {action}")
+                if isinstance(action, MacroAction):
+                    for step, delay in action.steps:
+                        if isinstance(step, KeyboardAction):
+                            kb.execute(step)
+                        else:
+                            mouse.execute(step)
+                        time.sleep(delay)
+                elif isinstance(action, KeyboardAction):
+                    kb.execute(action)
+                else:
+                    mouse.execute(action)
+                print(f"{ev.type} -> {action}")
 
             # Плавное движение курсора, только когда move_enabled=True и MEMS свежий
             if control_profile.upper() == "MOUSE_CONTROL" and move_enabled and mems_state.get("updated"):